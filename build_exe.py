@@ -13,7 +13,7 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 args = [
     'main.py',
     '--name=MarwanManagementCRM',
-    '--onefile',  # Create a single executable file
+    '--onedir',  # Folder build: no per-launch archive extraction like --onefile
     '--windowed',  # No console window (GUI app)
     '--icon=NONE',  # You can add an icon file later if needed
     '--hidden-import=PyQt6.QtCore',
@@ -26,8 +26,11 @@ args = [
     '--hidden-import=openpyxl',
     '--hidden-import=requests',
     '--hidden-import=psutil',
-    '--collect-all=matplotlib',
-    '--collect-all=PyQt6',
+    # Rely on import analysis (plus the hidden imports above) instead of
+    # --collect-all, and drop bundles we never import
+    '--exclude-module=tkinter',
+    '--exclude-module=matplotlib.tests',
+    '--exclude-module=PyQt6.QtWebEngineWidgets',
     '--add-data=LICENSE.txt;.',  # Include LICENSE.txt in the executable (Windows uses ; as separator)
     '--noconfirm',  # Overwrite output directory without asking
     '--clean',  # Clean PyInstaller cache before building
@@ -46,7 +49,7 @@ try:
     print("=" * 60)
     print("Build completed successfully!")
     print("=" * 60)
-    print(f"Executable location: {os.path.join(script_dir, 'dist', 'MarwanManagementCRM.exe')}")
+    print(f"Executable location: {os.path.join(script_dir, 'dist', 'MarwanManagementCRM', 'MarwanManagementCRM.exe')}")
     print()
     print("Note: The first run may be slower as the database is initialized.")
 except Exception as e:
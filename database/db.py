@@ -2,11 +2,12 @@
 Database module for Marwan Management CRM
 Handles SQLite database initialization, CRUD operations, and seed data
 """
+import functools
 import sqlite3
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import threading
+from typing import Iterable, List, Dict, Optional, Tuple
 
 
 def get_base_path():
@@ -29,26 +30,117 @@ def get_db_path():
     except (ImportError, Exception):
         # Config module not available or error reading config, use default
         pass
-    
+
     # Default path
     return os.path.join(get_base_path(), "restaurant_crm.db")
 
 
 DB_PATH = get_db_path()
 
+# Hot-path SQL hoisted to module-level constants so sqlite3's statement cache
+# always hits the already-compiled statement instead of re-parsing the text
+_SQL_GET_PRODUCT = "SELECT id, name, category, quantity, unit_price FROM products WHERE id = ?"
+_SQL_ADD_PRODUCT = "INSERT INTO products (name, category, quantity, unit_price) VALUES (?, ?, ?, ?)"
+_SQL_UPDATE_PRODUCT = "UPDATE products SET name = ?, category = ?, quantity = ?, unit_price = ? WHERE id = ?"
+_SQL_DELETE_PRODUCT = "DELETE FROM products WHERE id = ?"
+_SQL_GET_WASTE = "SELECT id, item, quantity, reason, date FROM waste WHERE id = ?"
+_SQL_ADD_WASTE = "INSERT INTO waste (item, quantity, reason, date) VALUES (?, ?, ?, ?)"
+# Omits the date column so the table's DEFAULT CURRENT_DATE fills it in
+_SQL_ADD_WASTE_TODAY = "INSERT INTO waste (item, quantity, reason) VALUES (?, ?, ?)"
+_SQL_UPDATE_WASTE = "UPDATE waste SET item = ?, quantity = ?, reason = ?, date = ? WHERE id = ?"
+_SQL_DELETE_WASTE = "DELETE FROM waste WHERE id = ?"
+_SQL_GET_ASSET = "SELECT id, name, type, purchase_date, value, condition FROM assets WHERE id = ?"
+_SQL_ADD_ASSET = "INSERT INTO assets (name, type, purchase_date, value, condition) VALUES (?, ?, ?, ?, ?)"
+_SQL_UPDATE_ASSET = "UPDATE assets SET name = ?, type = ?, purchase_date = ?, value = ?, condition = ? WHERE id = ?"
+_SQL_DELETE_ASSET = "DELETE FROM assets WHERE id = ?"
+_SQL_LOW_STOCK = "SELECT id, name, category, quantity, unit_price FROM products WHERE quantity < ? ORDER BY quantity ASC"
+
+# Shared connection, created lazily by get_connection().
+# Opening/closing a connection per call re-parses the schema and rebuilds the
+# page cache each time, so the connection is kept alive for the process.
+_conn = None
+_conn_lock = threading.Lock()
+# Serializes writes from UI callbacks/background threads over the shared connection
+_write_lock = threading.Lock()
+
+
+# In-process cache for read-mostly aggregate queries. Entries are keyed by
+# (function name, args) and tagged with the tables they depend on; mutators
+# call _invalidate() so the first read after a write goes back to SQLite.
+_query_cache: Dict[tuple, object] = {}
+_cache_tables: Dict[str, tuple] = {}
+# Bumped on every write; pages compare it to skip whole-page rebuilds when
+# nothing changed since their last refresh
+_data_version = 0
+
+
+def _memoize_read(*tables):
+    """Cache a read-only query function until one of its tables is written"""
+    def decorator(func):
+        _cache_tables[func.__name__] = tables
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__,) + args + tuple(sorted(kwargs.items()))
+            try:
+                return _query_cache[key]
+            except KeyError:
+                result = func(*args, **kwargs)
+                _query_cache[key] = result
+                return result
+        return wrapper
+    return decorator
+
+
+def data_version() -> int:
+    """Monotonic counter incremented whenever any table is written"""
+    return _data_version
+
+
+def _invalidate(*tables):
+    """Drop cached query results that depend on the given tables"""
+    global _data_version
+    _data_version += 1
+    tables = set(tables)
+    stale = [key for key in _query_cache
+             if tables.intersection(_cache_tables.get(key[0], ()))]
+    for key in stale:
+        del _query_cache[key]
+
 
 def get_connection():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get the shared database connection, creating it on first use"""
+    global _conn
+    if _conn is None:
+        with _conn_lock:
+            if _conn is None:
+                conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                                       cached_statements=256)
+                conn.row_factory = sqlite3.Row
+                # WAL keeps readers unblocked during writes and, together with
+                # synchronous=NORMAL, avoids a full fsync on every commit
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA cache_size=-16384")  # 16 MB page cache
+                conn.execute("PRAGMA temp_store=MEMORY")
+                _conn = conn
+    return _conn
+
+
+def close_database():
+    """Close the shared connection (call on application shutdown)"""
+    global _conn
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
 
 
 def init_database():
     """Initialize database with tables and seed data"""
     conn = get_connection()
     cursor = conn.cursor()
-    
+
     # Create products table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS products (
@@ -59,7 +151,7 @@ def init_database():
             unit_price REAL DEFAULT 0
         )
     """)
-    
+
     # Create waste table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS waste (
@@ -70,7 +162,7 @@ def init_database():
             date TEXT DEFAULT CURRENT_DATE
         )
     """)
-    
+
     # Create assets table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS assets (
@@ -82,19 +174,33 @@ def init_database():
             condition TEXT
         )
     """)
-    
-    conn.commit()
-    
+
+    # Indexes backing the grouping/ordering aggregate queries, so they run
+    # as index scans instead of full-table scans as the tables grow
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_waste_date ON waste(date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_waste_reason ON waste(reason)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_products_category ON products(category)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_products_quantity ON products(quantity)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_assets_type ON assets(type)")
+    # Partial index covering the low-stock dashboard query; thresholds in
+    # practice stay well under 50, so the index holds only the sparse tail
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_products_low_stock ON products(quantity) WHERE quantity < 50"
+    )
+
     # Check if database is empty and seed data
+    # (DDL above is auto-committed; seed_data commits its own transaction)
     cursor.execute("SELECT COUNT(*) FROM products")
     if cursor.fetchone()[0] == 0:
         seed_data(cursor, conn)
-    
-    conn.close()
 
 
 def seed_data(cursor, conn):
     """Seed database with sample FnB data"""
+    # All three inserts share one transaction so first-run seeding costs a
+    # single journal sync instead of one per table
+    cursor.execute("BEGIN")
+
     # Sample products
     products = [
         ("Tomatoes", "Vegetables", 50, 2.50),
@@ -110,12 +216,12 @@ def seed_data(cursor, conn):
         ("Milk", "Dairy", 40, 3.25),
         ("Eggs", "Dairy", 100, 4.50),
     ]
-    
+
     cursor.executemany(
         "INSERT INTO products (name, category, quantity, unit_price) VALUES (?, ?, ?, ?)",
         products
     )
-    
+
     # Sample waste entries
     waste_entries = [
         ("Tomatoes", 5, "Expired", "2025-11-10"),
@@ -125,12 +231,12 @@ def seed_data(cursor, conn):
         ("Onions", 4, "Damaged", "2025-11-11"),
         ("Chicken Breast", 1, "Expired", "2025-11-12"),
     ]
-    
+
     cursor.executemany(
         "INSERT INTO waste (item, quantity, reason, date) VALUES (?, ?, ?, ?)",
         waste_entries
     )
-    
+
     # Sample assets
     assets = [
         ("Commercial Refrigerator", "Equipment", "2023-01-15", 3500.00, "Good"),
@@ -140,363 +246,452 @@ def seed_data(cursor, conn):
         ("POS System", "Technology", "2023-11-01", 1200.00, "Excellent"),
         ("Dishwasher", "Equipment", "2022-12-10", 2800.00, "Good"),
     ]
-    
+
     cursor.executemany(
         "INSERT INTO assets (name, type, purchase_date, value, condition) VALUES (?, ?, ?, ?, ?)",
         assets
     )
-    
+
     conn.commit()
 
 
+def row_to_dict(row: sqlite3.Row) -> Dict:
+    """Convert a row to a plain dict (only needed at serialization boundaries)"""
+    return dict(row)
+
+
 # Products CRUD operations
-def get_all_products() -> List[Dict]:
-    """Get all products"""
+def iter_products() -> Iterable[sqlite3.Row]:
+    """Iterate over all products without materializing the result set"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM products ORDER BY name")
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    yield from conn.execute("SELECT id, name, category, quantity, unit_price FROM products ORDER BY name")
+
+
+def get_all_products() -> List[sqlite3.Row]:
+    """Get all products"""
+    return list(iter_products())
 
 
 def get_product(product_id: int) -> Optional[Dict]:
     """Get a single product by ID"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM products WHERE id = ?", (product_id,))
+    cursor = conn.execute(_SQL_GET_PRODUCT, (product_id,))
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
 def add_product(name: str, category: str, quantity: int, unit_price: float) -> int:
     """Add a new product"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO products (name, category, quantity, unit_price) VALUES (?, ?, ?, ?)",
-        (name, category, quantity, unit_price)
-    )
-    product_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        cursor = conn.execute(_SQL_ADD_PRODUCT, (name, category, quantity, unit_price))
+        product_id = cursor.lastrowid
+    _invalidate("products")
     return product_id
 
 
 def update_product(product_id: int, name: str, category: str, quantity: int, unit_price: float):
     """Update a product"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE products SET name = ?, category = ?, quantity = ?, unit_price = ? WHERE id = ?",
-        (name, category, quantity, unit_price, product_id)
-    )
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        conn.execute(_SQL_UPDATE_PRODUCT, (name, category, quantity, unit_price, product_id))
+    _invalidate("products")
 
 
 def delete_product(product_id: int):
     """Delete a product"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM products WHERE id = ?", (product_id,))
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        conn.execute(_SQL_DELETE_PRODUCT, (product_id,))
+    _invalidate("products")
 
 
 # Waste CRUD operations
-def get_all_waste() -> List[Dict]:
-    """Get all waste entries"""
+def iter_waste() -> Iterable[sqlite3.Row]:
+    """Iterate over all waste entries without materializing the result set"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM waste ORDER BY date DESC")
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    yield from conn.execute("SELECT id, item, quantity, reason, date FROM waste ORDER BY date DESC")
+
+
+def get_all_waste() -> List[sqlite3.Row]:
+    """Get all waste entries"""
+    return list(iter_waste())
 
 
 def get_waste(waste_id: int) -> Optional[Dict]:
     """Get a single waste entry by ID"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM waste WHERE id = ?", (waste_id,))
+    cursor = conn.execute(_SQL_GET_WASTE, (waste_id,))
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
 def add_waste(item: str, quantity: int, reason: str, date: str = None):
-    """Add a new waste entry"""
-    if date is None:
-        date = datetime.now().strftime("%Y-%m-%d")
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO waste (item, quantity, reason, date) VALUES (?, ?, ?, ?)",
-        (item, quantity, reason, date)
-    )
-    waste_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    """Add a new waste entry (date defaults to today via the column default)"""
+    conn = get_connection()
+    with _write_lock, conn:
+        if date is None:
+            cursor = conn.execute(_SQL_ADD_WASTE_TODAY, (item, quantity, reason))
+        else:
+            cursor = conn.execute(_SQL_ADD_WASTE, (item, quantity, reason, date))
+        waste_id = cursor.lastrowid
+    _invalidate("waste")
     return waste_id
 
 
 def update_waste(waste_id: int, item: str, quantity: int, reason: str, date: str):
     """Update a waste entry"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE waste SET item = ?, quantity = ?, reason = ?, date = ? WHERE id = ?",
-        (item, quantity, reason, date, waste_id)
-    )
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        conn.execute(_SQL_UPDATE_WASTE, (item, quantity, reason, date, waste_id))
+    _invalidate("waste")
 
 
 def delete_waste(waste_id: int):
     """Delete a waste entry"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM waste WHERE id = ?", (waste_id,))
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        conn.execute(_SQL_DELETE_WASTE, (waste_id,))
+    _invalidate("waste")
 
 
 # Assets CRUD operations
-def get_all_assets() -> List[Dict]:
-    """Get all assets"""
+def iter_assets(batch_size: int = 1000) -> Iterable[sqlite3.Row]:
+    """
+    Iterate over all assets without materializing the result set.
+
+    Rows are pulled from the cursor in fetchmany batches, so memory is
+    capped at batch_size rows no matter how large the table is.
+    """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM assets ORDER BY name")
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    cursor = conn.execute("SELECT id, name, type, purchase_date, value, condition FROM assets ORDER BY name")
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def get_all_assets() -> List[sqlite3.Row]:
+    """Get all assets"""
+    return list(iter_assets())
 
 
 def get_asset(asset_id: int) -> Optional[Dict]:
     """Get a single asset by ID"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM assets WHERE id = ?", (asset_id,))
+    cursor = conn.execute(_SQL_GET_ASSET, (asset_id,))
     row = cursor.fetchone()
-    conn.close()
     return dict(row) if row else None
 
 
 def add_asset(name: str, type: str, purchase_date: str, value: float, condition: str) -> int:
     """Add a new asset"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO assets (name, type, purchase_date, value, condition) VALUES (?, ?, ?, ?, ?)",
-        (name, type, purchase_date, value, condition)
-    )
-    asset_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        cursor = conn.execute(_SQL_ADD_ASSET, (name, type, purchase_date, value, condition))
+        asset_id = cursor.lastrowid
+    _invalidate("assets")
     return asset_id
 
 
 def update_asset(asset_id: int, name: str, type: str, purchase_date: str, value: float, condition: str):
     """Update an asset"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE assets SET name = ?, type = ?, purchase_date = ?, value = ?, condition = ? WHERE id = ?",
-        (name, type, purchase_date, value, condition, asset_id)
-    )
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        conn.execute(_SQL_UPDATE_ASSET, (name, type, purchase_date, value, condition, asset_id))
+    _invalidate("assets")
 
 
 def delete_asset(asset_id: int):
     """Delete an asset"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM assets WHERE id = ?", (asset_id,))
-    conn.commit()
-    conn.close()
+    with _write_lock, conn:
+        conn.execute(_SQL_DELETE_ASSET, (asset_id,))
+    _invalidate("assets")
+
+
+# Bulk insert operations (for imports; the single-row helpers are for UI use)
+def add_products_bulk(rows: Iterable[Tuple]) -> None:
+    """Insert many (name, category, quantity, unit_price) rows in one transaction"""
+    conn = get_connection()
+    with _write_lock, conn:
+        conn.executemany(_SQL_ADD_PRODUCT, rows)
+    _invalidate("products")
+
+
+def add_waste_bulk(rows: Iterable[Tuple]) -> None:
+    """Insert many (item, quantity, reason, date) rows in one transaction"""
+    conn = get_connection()
+    with _write_lock, conn:
+        conn.executemany(_SQL_ADD_WASTE, rows)
+    _invalidate("waste")
+
+
+def add_assets_bulk(rows: Iterable[Tuple]) -> None:
+    """Insert many (name, type, purchase_date, value, condition) rows in one transaction"""
+    conn = get_connection()
+    with _write_lock, conn:
+        conn.executemany(_SQL_ADD_ASSET, rows)
+    _invalidate("assets")
+
+
+def delete_assets_bulk(ids: Iterable[int]) -> None:
+    """Delete many assets by id in one statement and one commit"""
+    ids = list(ids)
+    if not ids:
+        return
+    conn = get_connection()
+    with _write_lock, conn:
+        conn.execute(
+            f"DELETE FROM assets WHERE id IN ({','.join('?' * len(ids))})", ids
+        )
+    _invalidate("assets")
 
 
 # Summary/Statistics functions
+@_memoize_read("products")
 def get_products_count() -> int:
     """Get total number of products"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT COUNT(*) FROM products")
+    cursor = conn.execute("SELECT COUNT(*) FROM products")
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 
+@_memoize_read("waste")
 def get_total_waste_quantity() -> int:
     """Get total waste quantity"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT COALESCE(SUM(quantity), 0) FROM waste")
+    cursor = conn.execute("SELECT COALESCE(SUM(quantity), 0) FROM waste")
     total = cursor.fetchone()[0]
-    conn.close()
     return total
 
 
+@_memoize_read("assets")
 def get_total_asset_value() -> float:
     """Get total asset value"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT COALESCE(SUM(value), 0) FROM assets")
+    cursor = conn.execute("SELECT COALESCE(SUM(value), 0) FROM assets")
     total = cursor.fetchone()[0]
-    conn.close()
     return total
 
 
+@_memoize_read("waste")
 def get_waste_by_reason() -> List[Tuple[str, int]]:
     """Get waste grouped by reason"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT COALESCE(reason, 'Unknown') as reason, SUM(quantity) as total FROM waste GROUP BY reason ORDER BY total DESC"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0] or 'Unknown', row[1] or 0) for row in rows]
 
 
+@_memoize_read("products")
+def get_products_summary() -> Dict:
+    """Get product count, inventory value and average price in one scan"""
+    conn = get_connection()
+    cursor = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(quantity * unit_price), 0), COALESCE(AVG(unit_price), 0) FROM products"
+    )
+    row = cursor.fetchone()
+    return {"count": row[0], "inventory_value": row[1], "avg_price": row[2]}
+
+
+@_memoize_read("assets")
+def get_assets_summary() -> Dict:
+    """Get asset count, value totals and distinct type/condition counts in one scan"""
+    conn = get_connection()
+    cursor = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(value), 0), COALESCE(AVG(value), 0), "
+        "COUNT(DISTINCT type), COUNT(DISTINCT condition) FROM assets"
+    )
+    row = cursor.fetchone()
+    return {
+        "count": row[0],
+        "total_value": row[1],
+        "avg_value": row[2],
+        "types": row[3],
+        "conditions": row[4],
+    }
+
+
+@_memoize_read("products", "waste", "assets")
+def get_dashboard_snapshot() -> Dict:
+    """Get all scalar dashboard KPIs in a single query"""
+    conn = get_connection()
+    # Scalar subqueries let SQLite return every KPI in one row, instead of
+    # one round trip per metric when the dashboard refreshes
+    cursor = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM products),
+            (SELECT COALESCE(SUM(quantity * unit_price), 0) FROM products),
+            (SELECT COALESCE(AVG(unit_price), 0) FROM products),
+            (SELECT COALESCE(SUM(quantity), 0) FROM waste),
+            (SELECT COALESCE(SUM(value), 0) FROM assets),
+            (SELECT COALESCE(AVG(value), 0) FROM assets)
+    """)
+    row = cursor.fetchone()
+    return {
+        "products_count": row[0],
+        "inventory_value": row[1],
+        "avg_product_price": row[2],
+        "waste_quantity": row[3],
+        "asset_value": row[4],
+        "avg_asset_value": row[5],
+    }
+
+
 # Enhanced analytics functions
+@_memoize_read("products")
 def get_total_inventory_value() -> float:
     """Get total inventory value (sum of quantity * unit_price)"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT COALESCE(SUM(quantity * unit_price), 0) FROM products")
+    cursor = conn.execute("SELECT COALESCE(SUM(quantity * unit_price), 0) FROM products")
     total = cursor.fetchone()[0]
-    conn.close()
     return total
 
 
+@_memoize_read("products")
 def get_products_by_category() -> List[Tuple[str, int]]:
     """Get product count grouped by category"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT category, COUNT(*) as count FROM products WHERE category IS NOT NULL AND category != '' GROUP BY category ORDER BY count DESC"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0], row[1]) for row in rows]
 
 
+@_memoize_read("products")
 def get_all_categories() -> List[str]:
     """Get all unique categories from products"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT DISTINCT category FROM products WHERE category IS NOT NULL AND category != '' ORDER BY category"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [row[0] for row in rows]
 
 
+@_memoize_read("products")
 def get_inventory_value_by_category() -> List[Tuple[str, float]]:
     """Get inventory value grouped by category"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT category, COALESCE(SUM(quantity * unit_price), 0) as value FROM products WHERE category IS NOT NULL AND category != '' GROUP BY category ORDER BY value DESC"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0], row[1]) for row in rows]
 
 
-def get_low_stock_products(threshold: int = 20) -> List[Dict]:
+@_memoize_read("products")
+def get_low_stock_products(threshold: int = 20) -> List[sqlite3.Row]:
     """Get products with quantity below threshold"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT * FROM products WHERE quantity < ? ORDER BY quantity ASC",
-        (threshold,)
-    )
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    cursor = conn.execute(_SQL_LOW_STOCK, (threshold,))
+    return cursor.fetchall()
 
 
+@_memoize_read("products")
 def get_average_product_price() -> float:
     """Get average product unit price"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT COALESCE(AVG(unit_price), 0) FROM products")
+    cursor = conn.execute("SELECT COALESCE(AVG(unit_price), 0) FROM products")
     avg = cursor.fetchone()[0]
-    conn.close()
     return avg
 
 
+@_memoize_read("waste")
 def get_waste_by_item() -> List[Tuple[str, int]]:
     """Get waste grouped by item"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT COALESCE(item, 'Unknown') as item, SUM(quantity) as total FROM waste GROUP BY item ORDER BY total DESC LIMIT 10"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0] or 'Unknown', row[1] or 0) for row in rows]
 
 
+@_memoize_read("waste")
 def get_waste_trend() -> List[Tuple[str, int]]:
     """Get waste quantity by date"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT date, SUM(quantity) as total FROM waste GROUP BY date ORDER BY date DESC LIMIT 7"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0], row[1]) for row in rows]
 
 
+@_memoize_read("assets")
 def get_assets_by_type() -> List[Tuple[str, int]]:
     """Get asset count grouped by type"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT COALESCE(type, 'Unknown') as type, COUNT(*) as count FROM assets WHERE type IS NOT NULL AND type != '' GROUP BY type ORDER BY count DESC"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0] or 'Unknown', row[1] or 0) for row in rows]
 
 
+@_memoize_read("assets")
 def get_assets_by_condition() -> List[Tuple[str, int]]:
     """Get asset count grouped by condition"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT COALESCE(condition, 'Unknown') as condition, COUNT(*) as count FROM assets WHERE condition IS NOT NULL AND condition != '' GROUP BY condition ORDER BY count DESC"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0] or 'Unknown', row[1] or 0) for row in rows]
 
 
+@_memoize_read("assets")
 def get_assets_value_by_type() -> List[Tuple[str, float]]:
     """Get asset value grouped by type"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
+    cursor = conn.execute(
         "SELECT COALESCE(type, 'Unknown') as type, COALESCE(SUM(value), 0) as total_value FROM assets WHERE type IS NOT NULL AND type != '' GROUP BY type ORDER BY total_value DESC"
     )
     rows = cursor.fetchall()
-    conn.close()
     return [(row[0] or 'Unknown', float(row[1] or 0)) for row in rows]
 
 
+@_memoize_read("products", "waste", "assets")
+def get_analytics_bundle() -> Dict:
+    """Fetch all eight analytics aggregations in one consistent snapshot
+
+    The analytics page needs every result set at once; running the reads
+    inside a single transaction keeps them mutually consistent and lets
+    SQLite serve them from a warm page cache, instead of eight independent
+    round trips interleaved with chart rendering.
+    """
+    conn = get_connection()
+    with _write_lock:
+        conn.execute("BEGIN")
+        try:
+            bundle = {
+                "products_by_category": get_products_by_category(),
+                "inventory_value_by_category": get_inventory_value_by_category(),
+                "waste_by_reason": get_waste_by_reason(),
+                "waste_by_item": get_waste_by_item(),
+                "waste_trend": get_waste_trend(),
+                "assets_by_type": get_assets_by_type(),
+                "assets_by_condition": get_assets_by_condition(),
+                "assets_value_by_type": get_assets_value_by_type(),
+            }
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return bundle
+
+
+@_memoize_read("assets")
 def get_average_asset_value() -> float:
     """Get average asset value"""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT COALESCE(AVG(value), 0) FROM assets")
+    cursor = conn.execute("SELECT COALESCE(AVG(value), 0) FROM assets")
     avg = cursor.fetchone()[0]
-    conn.close()
-    return avg
\ No newline at end of file
+    return avg
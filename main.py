@@ -2,62 +2,187 @@
 Marwan Management CRM - Main Application
 Food & Beverage Restaurant Management System
 """
+import functools
 import sys
+import time
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QStackedWidget, QLabel, QFrame
+    QPushButton, QLabel, QFrame
 )
-from PyQt6.QtCore import Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QIcon, QPixmap, QPainter, QColor
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve, QObject, QRunnable,
+    QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QFontDatabase, QIcon, QPixmap, QPainter, QColor
 from utils.icons import get_icon, create_icon_button
 
-from database.db import init_database
-from ui.dashboard import DashboardPage
-from ui.products import ProductsPage
-from ui.waste import WastePage
-from ui.assets import AssetsPage
-from ui.analytics import AnalyticsPage
+from database.db import init_database, close_database, data_version
 from ui.splash import SplashScreen
-from ui.setup_wizard import SetupWizard
-from utils.updater_ui import show_update_dialog
-from utils.config import is_setup_complete, should_rerun_wizard
+from utils.config import (
+    is_setup_complete, should_rerun_wizard,
+    get_last_update_check_ts, set_last_update_check_ts
+)
+
+# The page modules (which pull in matplotlib via utils.charts), the setup
+# wizard and the updater stack are imported lazily so the splash can paint
+# before those libraries load; see _import_pages and the call sites below.
+
+
+_FONT_FAMILY = "Segoe UI"
+
+# Single switch for the startup update check, instead of commenting the
+# QTimer call in and out
+AUTO_CHECK_UPDATES = True
+
+# Minimum seconds between GitHub update checks within one session
+_UPDATE_CHECK_TTL = 900
+
+# Application-wide stylesheet, built once at import so apply_styles hands Qt
+# the same interned string instead of re-creating it per call
+_GLOBAL_QSS = """
+    QMainWindow {
+        background-color: #f5f7fa;
+    }
+    QFrame#sidebar {
+        background-color: #ffffff;
+        border-right: 1px solid #e1e8ed;
+    }
+    QFrame#topBar {
+        background-color: #ffffff;
+        border-bottom: 2px solid #e1e8ed;
+        padding: 0px;
+    }
+    QLabel#sidebarTitle {
+        color: #2c3e50;
+        padding: 10px 0px;
+    }
+    QLabel#sidebarSubtitle {
+        color: #7f8c8d;
+        padding-bottom: 15px;
+    }
+    QFrame#sidebarSeparator {
+        color: #e0e0e0;
+        margin: 10px 0px;
+    }
+    QLabel#pageTitle {
+        color: #2c3e50;
+        padding: 5px 0px;
+    }
+    QLabel#sectionHeader {
+        color: #34495e;
+        margin-top: 20px;
+        margin-bottom: 10px;
+        padding-top: 10px;
+        border-top: 2px solid #e1e8ed;
+    }
+    QFrame#chartFrame {
+        background-color: white;
+        border: 1px solid #e1e8ed;
+        border-radius: 8px;
+    }
+    QPushButton#navButton {
+        background-color: transparent;
+        color: #34495e;
+        border: none;
+        border-radius: 6px;
+        text-align: left;
+        padding: 12px 15px;
+        font-size: 14px;
+        font-weight: 500;
+        font-family: 'Segoe UI';
+    }
+    QPushButton#navButton:hover {
+        background-color: #f8f9fa;
+        color: #2c3e50;
+    }
+    QPushButton#navButton[selected="true"] {
+        background-color: #3498db;
+        color: white;
+        font-weight: 600;
+    }
+    QPushButton#navButton[selected="true"]:hover {
+        background-color: #2980b9;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _ui_font(size: int, bold: bool = False) -> QFont:
+    """Shared QFont instances; construction hits the font database once per size"""
+    if bold:
+        return QFont(_FONT_FAMILY, size, QFont.Weight.Bold)
+    return QFont(_FONT_FAMILY, size)
+
+
+def _import_pages():
+    """Import the page classes on first use, after the splash is visible"""
+    from ui.dashboard import DashboardPage
+    from ui.products import ProductsPage
+    from ui.waste import WastePage
+    from ui.assets import AssetsPage
+    from ui.analytics import AnalyticsPage
+    return (DashboardPage, ProductsPage, WastePage, AssetsPage, AnalyticsPage)
+
+
+class DBInitWorker(QRunnable):
+    """Runs sqlite schema creation and seeding off the GUI thread"""
+
+    class Signals(QObject):
+        done = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.signals = DBInitWorker.Signals()
+
+    def run(self):
+        init_database()
+        self.signals.done.emit()
+
+
+class UpdateCheckWorker(QRunnable):
+    """Runs the GitHub update check on a thread-pool thread"""
+
+    class Signals(QObject):
+        finished = pyqtSignal(bool, object)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = UpdateCheckWorker.Signals()
+
+    def run(self):
+        try:
+            # First check pays the `requests` import here, off the GUI thread
+            from utils.updater import check_for_updates as _check_updates, GITHUB_REPO
+            update_available, latest_version, release_info = _check_updates(GITHUB_REPO)
+            self.signals.finished.emit(bool(update_available), release_info)
+        except Exception:
+            # Silently fail - don't interrupt user experience
+            self.signals.finished.emit(False, None)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, splash_screen=None):
+    def __init__(self, splash_screen=None, skip_styles: bool = False):
         super().__init__()
         self.splash = splash_screen
+        # When the caller applies the stylesheet application-wide (or in a
+        # benchmark harness), skip the per-window parse here
+        self._skip_styles = skip_styles
         self.setWindowTitle("Marwan Management CRM - FnB")
-        
-        # Center window on screen, ensuring it's always visible
-        from PyQt6.QtWidgets import QApplication
-        screen = QApplication.primaryScreen().geometry()
-        window_width = 1400
-        window_height = 900
-        
-        # Calculate center position
-        x = (screen.width() - window_width) // 2
-        y = (screen.height() - window_height) // 2
-        
-        # Ensure window is always on-screen (no negative coordinates)
-        x = max(0, x)
-        y = max(0, y)
-        
-        # If window is larger than screen, adjust to fit
-        if window_width > screen.width():
-            x = 0
-            window_width = screen.width()
-        if window_height > screen.height():
-            y = 0
-            window_height = screen.height()
-        
-        self.setGeometry(x, y, window_width, window_height)
-        
-        # Initialize database
-        if self.splash:
-            self.splash.update_status("Initializing database...", 5)
-        init_database()
-        
+
+        # Plain top-level window flags, set once before the native window is
+        # created; setting them after show() would force a re-parenting
+        # round-trip to the window manager
+        flags = self.windowFlags()
+        flags = flags & ~Qt.WindowType.WindowStaysOnTopHint
+        flags = flags & ~Qt.WindowType.SplashScreen
+        flags = flags | Qt.WindowType.Window
+        self.setWindowFlags(flags)
+
+        # Seed the restore size only; show_main_window maximizes the window,
+        # which makes centering and clamping against the screen pointless
+        self.resize(1400, 900)
+
+
         # Create central widget
         if self.splash:
             self.splash.update_status("Setting up interface...", 15)
@@ -69,6 +194,10 @@ class MainWindow(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
+        # Suppress intermediate repaints while the chrome is assembled;
+        # re-enabled once the full widget tree is in place
+        self.setUpdatesEnabled(False)
+
         # Sidebar
         if self.splash:
             self.splash.update_status("Creating navigation sidebar...", 25)
@@ -87,52 +216,69 @@ class MainWindow(QMainWindow):
         top_bar = self.create_top_bar()
         content_layout.addWidget(top_bar)
         
-        # Stacked widget for pages
-        self.stacked_widget = QStackedWidget()
-        content_layout.addWidget(self.stacked_widget)
-        
-        # Create pages with progress updates
-        if self.splash:
-            self.splash.update_status("Loading Dashboard page...", 45)
-        self.dashboard_page = DashboardPage()
-        self.stacked_widget.addWidget(self.dashboard_page)
-        
-        if self.splash:
-            self.splash.update_status("Loading Products page...", 60)
-        self.products_page = ProductsPage()
-        self.stacked_widget.addWidget(self.products_page)
-        
-        if self.splash:
-            self.splash.update_status("Loading Waste page...", 75)
-        self.waste_page = WastePage()
-        self.stacked_widget.addWidget(self.waste_page)
-        
-        if self.splash:
-            self.splash.update_status("Loading Assets page...", 85)
-        self.assets_page = AssetsPage()
-        self.stacked_widget.addWidget(self.assets_page)
-        
-        if self.splash:
-            self.splash.update_status("Loading Analytics page...", 90)
-        self.analytics_page = AnalyticsPage()
-        self.stacked_widget.addWidget(self.analytics_page)
-        
+        # Page host: a bare container with explicit show/hide of the active
+        # page, so hidden pages don't participate in layout invalidation the
+        # way QStackedWidget children do
+        self._page_host = QWidget()
+        self._page_host_layout = QVBoxLayout(self._page_host)
+        self._page_host_layout.setContentsMargins(0, 0, 0, 0)
+        self._page_host_layout.setSpacing(0)
+        content_layout.addWidget(self._page_host)
+        
+        # Page factories: only the dashboard is constructed up front, the
+        # other pages are built on first navigation to keep startup light
+        self._page_factories = _import_pages()
+        self._pages = [None] * len(self._page_factories)
+        # Bound refresh methods, captured once per page at construction time
+        self._refreshers = [None] * len(self._page_factories)
+        # data_version each page last rendered; gates refresh on tab switch
+        self._page_versions = [None] * len(self._page_factories)
+        self._current_index = -1
+        # Navigation is held back until the database worker reports done;
+        # clicks that arrive earlier park their target index here
+        self._db_ready = False
+        self._pending_index = 0
+        # monotonic timestamp of the last update check; seeds the TTL window
+        self._last_update_check = -_UPDATE_CHECK_TTL
+
         main_layout.addWidget(content_widget, stretch=1)
-        
-        # Set default page
-        if self.splash:
-            self.splash.update_status("Finalizing setup...", 95)
-        self.navigate_to_page(0)
-        
+
         # Apply styles
-        self.apply_styles()
-        
-        # Complete loading
+        if not self._skip_styles:
+            self.apply_styles()
+
+        self.setUpdatesEnabled(True)
+
+        # Kick off database init on the thread pool only now that the window
+        # is fully constructed: the splash's update_status calls
+        # processEvents(), which would deliver the queued done signal
+        # mid-constructor and run _on_db_ready against a half-built window.
+        # The first page still overlaps init with splash fade/show.
         if self.splash:
-            self.splash.update_status("Ready!", 100)
-        
+            self.splash.update_status("Initializing database...", 20)
+        self._db_worker = DBInitWorker()
+        self._db_worker.signals.done.connect(self._on_db_ready)
+        QThreadPool.globalInstance().start(self._db_worker)
+
         # Auto-check for updates on startup (after 2 seconds delay)
-        QTimer.singleShot(2000, self.check_for_updates)
+        if AUTO_CHECK_UPDATES:
+            QTimer.singleShot(2000, self.check_for_updates)
+
+    def _on_db_ready(self):
+        """Build the default page once the background database init finishes
+
+        Connected as a queued signal from DBInitWorker, so this runs on the
+        GUI thread after the event loop has started and the chrome painted.
+        """
+        if self.splash:
+            self.splash.update_status("Loading Dashboard page...", 85)
+        self._db_ready = True
+        # Replay the last index clicked while init was running (default 0)
+        self.navigate_to_page(self._pending_index)
+        self.dashboard_page = self._pages[0]
+
+        if self.splash:
+            self.splash.update_status("Ready!", 100)
     
     def create_sidebar(self) -> QWidget:
         """Create the sidebar navigation"""
@@ -150,25 +296,27 @@ class MainWindow(QMainWindow):
         title_layout.setContentsMargins(0, 0, 0, 0)
         title_layout.setSpacing(5)
         
+        # Styled via object names in the global stylesheet, so each label
+        # doesn't carry its own per-widget stylesheet to resolve
         title = QLabel("Marwan CRM")
-        title.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+        title.setFont(_ui_font(20, bold=True))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("color: #2c3e50; padding: 10px 0px;")
+        title.setObjectName("sidebarTitle")
         title_layout.addWidget(title)
-        
+
         subtitle = QLabel("Food & Beverage Management")
-        subtitle.setFont(QFont("Segoe UI", 9))
+        subtitle.setFont(_ui_font(9))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: #7f8c8d; padding-bottom: 15px;")
+        subtitle.setObjectName("sidebarSubtitle")
         title_layout.addWidget(subtitle)
-        
+
         layout.addWidget(title_container)
-        
+
         # Separator line
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("color: #e0e0e0; margin: 10px 0px;")
+        separator.setObjectName("sidebarSeparator")
         layout.addWidget(separator)
         
         layout.addSpacing(10)
@@ -180,28 +328,28 @@ class MainWindow(QMainWindow):
         self.btn_assets = create_icon_button("Assets", "assets")
         self.btn_analytics = create_icon_button("Analytics", "analytics")
         
-        buttons = [
+        # Hoisted to tuples so navigate_to_page doesn't rebuild these per click
+        self._nav_buttons = (
             self.btn_dashboard,
             self.btn_products,
             self.btn_waste,
             self.btn_assets,
             self.btn_analytics
-        ]
-        
-        for btn in buttons:
+        )
+        self._nav_titles = ("Dashboard", "Products", "Waste", "Assets", "Analytics")
+
+        # One shared slot resolves the clicked button to its page index,
+        # instead of a captured lambda per button
+        self._btn_index = {btn: i for i, btn in enumerate(self._nav_buttons)}
+
+        for btn in self._nav_buttons:
             btn.setFixedHeight(48)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setObjectName("navButton")
             btn.setIconSize(QSize(20, 20))
+            btn.clicked.connect(self._on_nav_clicked)
             layout.addWidget(btn)
         
-        # Connect buttons
-        self.btn_dashboard.clicked.connect(lambda: self.navigate_to_page(0))
-        self.btn_products.clicked.connect(lambda: self.navigate_to_page(1))
-        self.btn_waste.clicked.connect(lambda: self.navigate_to_page(2))
-        self.btn_assets.clicked.connect(lambda: self.navigate_to_page(3))
-        self.btn_analytics.clicked.connect(lambda: self.navigate_to_page(4))
-        
         layout.addStretch()
         
         return sidebar
@@ -217,116 +365,161 @@ class MainWindow(QMainWindow):
         
         # Title (will be updated based on current page)
         self.page_title = QLabel("Dashboard")
-        self.page_title.setFont(QFont("Segoe UI", 18, QFont.Weight.Bold))
-        self.page_title.setStyleSheet("color: #2c3e50; padding: 5px 0px;")
+        self.page_title.setFont(_ui_font(18, bold=True))
+        self.page_title.setObjectName("pageTitle")
         layout.addWidget(self.page_title)
         
         layout.addStretch()
         
         return top_bar
     
+    def _on_nav_clicked(self):
+        """Navigate to the page for the sidebar button that was clicked"""
+        self.navigate_to_page(self._btn_index[self.sender()])
+
+    def _ensure_page(self, index: int) -> QWidget:
+        """Get the page for an index, constructing it on first use"""
+        if self._pages[index] is None:
+            page = self._page_factories[index]()
+            self._pages[index] = page
+            self._refreshers[index] = getattr(page, 'refresh', None)
+            page.hide()
+            self._page_host_layout.addWidget(page)
+        return self._pages[index]
+
     def navigate_to_page(self, index: int):
         """Navigate to a specific page"""
-        self.stacked_widget.setCurrentIndex(index)
+        # Until the schema exists, building a page would crash its refresh
+        # with "no such table"; remember the target and let _on_db_ready
+        # replay it once the database worker finishes
+        if not self._db_ready:
+            self._pending_index = index
+            return
+
+        # Re-clicking the active button would redo the style flip and a full
+        # page refresh for no visible change
+        if index == self._current_index:
+            return
+
+        page = self._ensure_page(index)
+        if 0 <= self._current_index < len(self._pages):
+            previous = self._pages[self._current_index]
+            if previous is not None:
+                previous.hide()
+        page.show()
         
         # Update page title
-        titles = ["Dashboard", "Products", "Waste", "Assets", "Analytics"]
-        self.page_title.setText(titles[index])
-        
-        # Update button styles
-        buttons = [
-            self.btn_dashboard,
-            self.btn_products,
-            self.btn_waste,
-            self.btn_assets,
-            self.btn_analytics
-        ]
-        
-        for i, btn in enumerate(buttons):
-            if i == index:
-                btn.setStyleSheet("""
-                    QPushButton#navButton {
-                        background-color: #3498db;
-                        color: white;
-                        border: none;
-                        border-radius: 6px;
-                        text-align: left;
-                        padding: 12px 15px;
-                        font-size: 14px;
-                        font-weight: 600;
-                        font-family: 'Segoe UI';
-                    }
-                    QPushButton#navButton:hover {
-                        background-color: #2980b9;
-                    }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton#navButton {
-                        background-color: transparent;
-                        color: #34495e;
-                        border: none;
-                        border-radius: 6px;
-                        text-align: left;
-                        padding: 12px 15px;
-                        font-size: 14px;
-                        font-weight: 500;
-                        font-family: 'Segoe UI';
-                    }
-                    QPushButton#navButton:hover {
-                        background-color: #f8f9fa;
-                        color: #2c3e50;
-                    }
-                """)
-        
-        # Refresh current page if it has a refresh method
-        current_widget = self.stacked_widget.currentWidget()
-        if hasattr(current_widget, 'refresh'):
-            current_widget.refresh()
+        self.page_title.setText(self._nav_titles[index])
+
+        buttons = self._nav_buttons
+
+        # Flip the dynamic 'selected' property on the two buttons whose state
+        # actually changed; the global stylesheet supplies both looks, so no
+        # per-click CSS parsing happens here
+        if self._current_index != index:
+            for i in (self._current_index, index):
+                if 0 <= i < len(buttons):
+                    btn = buttons[i]
+                    btn.setProperty("selected", i == index)
+                    btn.style().unpolish(btn)
+                    btn.style().polish(btn)
+            self._current_index = index
+        
+        # Refresh via the bound method captured at construction, but only
+        # when a write happened since this page was last rendered — toggling
+        # between tabs with unchanged data re-runs nothing. Pages whose
+        # refresh completes asynchronously clear refresh_ok when it fails,
+        # which overrides the recorded version and forces a retry here
+        refresh = self._refreshers[index]
+        if refresh:
+            version = data_version()
+            if (self._page_versions[index] != version
+                    or not getattr(page, 'refresh_ok', True)):
+                refresh()
+                self._page_versions[index] = version
     
     def check_for_updates(self):
-        """Check for updates silently in background"""
-        # Check for updates without showing dialog unless update is available
-        from utils.updater import check_for_updates, APP_VERSION, GITHUB_REPO
-        from PyQt6.QtWidgets import QMessageBox
-        
-        try:
-            update_available, latest_version, release_info = check_for_updates(GITHUB_REPO)
-            
-            if update_available and release_info:
-                # Show update dialog only if update is available
-                show_update_dialog(self, auto_check=True)
-            # If no update or no releases, do nothing (silent check)
-        except Exception as e:
-            # Silently fail - don't interrupt user experience
-            pass
+        """Check for updates silently in the background"""
+        # Rate-limit the GitHub round-trip: repeated triggers within the TTL
+        # reuse the previous answer implicitly by doing nothing
+        now = time.monotonic()
+        if now - self._last_update_check < _UPDATE_CHECK_TTL:
+            return
+
+        # Across launches: one check per day is plenty for a desktop app,
+        # so most startups skip the HTTP request entirely
+        if time.time() - get_last_update_check_ts() < 86400:
+            return
+
+        self._last_update_check = now
+        set_last_update_check_ts(time.time())
+
+        # The network round-trip runs on the global thread pool so the GUI
+        # thread never blocks on GitHub; the result comes back via a signal
+        worker = UpdateCheckWorker()
+        worker.signals.finished.connect(self._on_update_check_done)
+        self._update_worker = worker  # keep a reference while it runs
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_update_check_done(self, update_available: bool, release_info):
+        """Show the update dialog only if the background check found a release"""
+        if update_available and release_info:
+            from utils.updater_ui import show_update_dialog
+            show_update_dialog(self, auto_check=True)
+        # If no update or no releases, do nothing (silent check)
     
     def apply_styles(self):
-        """Apply application-wide styles"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f7fa;
-            }
-            QFrame#sidebar {
-                background-color: #ffffff;
-                border-right: 1px solid #e1e8ed;
-            }
-            QFrame#topBar {
-                background-color: #ffffff;
-                border-bottom: 2px solid #e1e8ed;
-                padding: 0px;
-            }
-        """)
+        """Apply the global stylesheet to this window
+
+        main() installs _GLOBAL_QSS at the application level, which already
+        covers this window; the per-window parse only happens for callers
+        that construct MainWindow without going through main().
+        """
+        app = QApplication.instance()
+        if app and app.styleSheet():
+            return
+        self.setStyleSheet(_GLOBAL_QSS)
 
 
 # Global reference to keep window alive
 _main_window = None
-_window_shown = False
+
+
+def _resolve_font_family():
+    """Pick the UI font family once, before any widget asks for a QFont
+
+    Qt falls back per-QFont when "Segoe UI" is missing (non-Windows hosts),
+    which re-runs font matching for every label; resolving the family up
+    front makes every _ui_font call an exact match.
+    """
+    global _FONT_FAMILY
+    if _FONT_FAMILY not in QFontDatabase.families():
+        _FONT_FAMILY = "Arial"
+    _ui_font.cache_clear()
+
+
+def _clear_lazy_pixmap_caches():
+    """Drop QPixmap caches owned by lazily imported page modules
+
+    The dashboard's emoji cache must not outlive the QApplication, same as
+    the icon cache; looked up via sys.modules so wiring this at startup
+    doesn't defeat the lazy import of the page modules.
+    """
+    dashboard = sys.modules.get('ui.dashboard')
+    if dashboard is not None:
+        dashboard._emoji_pixmap.cache_clear()
 
 
 def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    # One application-level parse covers every window, including the splash
+    app.setStyleSheet(_GLOBAL_QSS)
+    app.aboutToQuit.connect(close_database)
+    # The icon cache holds QPixmaps that must not outlive the QApplication
+    app.aboutToQuit.connect(get_icon.cache_clear)
+    app.aboutToQuit.connect(_clear_lazy_pixmap_caches)
+    _resolve_font_family()
     
     # Skip setup wizard when running as script (development mode)
     # Only show wizard when running as compiled executable
@@ -334,7 +527,8 @@ def main():
     
     # Check if setup is needed (only for compiled executable)
     if is_compiled and (not is_setup_complete() or should_rerun_wizard()):
-        # Show setup wizard
+        # Show setup wizard (imported here so dev-mode startup never loads it)
+        from ui.setup_wizard import SetupWizard
         wizard = SetupWizard()
         wizard.show()
         wizard.fade_in()
@@ -347,7 +541,7 @@ def main():
                 splash.show()
                 splash.fade_in()
                 app.processEvents()
-                QTimer.singleShot(300, lambda: load_application(app, splash))
+                QTimer.singleShot(0, lambda: load_application(app, splash))
             else:
                 # User cancelled or chose not to launch
                 app.quit()
@@ -361,9 +555,10 @@ def main():
         
         # Process events to ensure splash is visible
         app.processEvents()
-        
-        # Small delay to show splash
-        QTimer.singleShot(300, lambda: load_application(app, splash))
+
+        # Start loading on the next event-loop pass; the splash has already
+        # painted, so no artificial delay is needed
+        QTimer.singleShot(0, lambda: load_application(app, splash))
     
     # Start the application event loop
     sys.exit(app.exec())
@@ -378,9 +573,8 @@ def load_application(app, splash):
         _main_window = MainWindow(splash_screen=splash)
         print("Main window created")
         _main_window.hide()  # Keep hidden until loading is complete
-        
-        # Small delay to ensure everything is ready
-        QTimer.singleShot(500, lambda: finish_loading(app, splash))
+
+        finish_loading(app, splash)
     except Exception as e:
         # If loading fails, show error and close splash
         import traceback
@@ -405,78 +599,37 @@ def finish_loading(app, splash):
     print("Preparing to show main window...")
     # Show window immediately, then fade out splash
     show_main_window(splash)
-    
-    # Fade out splash after a short delay
-    QTimer.singleShot(300, lambda: close_splash(splash))
+    close_splash(splash)
 
 
 def close_splash(splash):
     """Close the splash screen"""
     if splash:
         print("Closing splash screen...")
-        splash.fade_out()
-        QTimer.singleShot(600, lambda: splash.close())
+        # Close when the fade animation reports it finished, instead of a
+        # fixed timer guessing at its duration
+        splash.fade_out(callback=splash.close)
 
 
 def show_main_window(splash):
     """Show main window (splash will be closed separately)"""
-    global _main_window, _window_shown
+    global _main_window
     print("Showing main window...")
-    
+
     if _main_window is None:
         print("ERROR: _main_window is None!")
         return
-    
+
     # Prevent showing multiple times
-    if _window_shown:
-        print("Window already shown, skipping...")
+    if _main_window.isVisible():
         return
-    
-    _window_shown = True
-    
-    # Process events first
-    from PyQt6.QtWidgets import QApplication
-    QApplication.processEvents()
-    
-    # Ensure window is on-screen before showing
-    screen = QApplication.primaryScreen().geometry()
-    current_geom = _main_window.geometry()
-    
-    # Fix negative coordinates - ensure window is visible
-    x = current_geom.x()
-    y = current_geom.y()
-    if x < 0 or y < 0:
-        x = max(0, x)
-        y = max(0, y)
-        _main_window.move(x, y)
-        print(f"Fixed window position from ({current_geom.x()}, {current_geom.y()}) to ({x}, {y})")
-    
-    # Make sure window flags are correct - remove any splash-like flags
-    flags = _main_window.windowFlags()
-    flags = flags & ~Qt.WindowType.WindowStaysOnTopHint
-    flags = flags & ~Qt.WindowType.SplashScreen
-    flags = flags | Qt.WindowType.Window
-    _main_window.setWindowFlags(flags)
-    
-    # Set window to be visible and on top
+
+    # Window flags were fixed up in __init__ before the native window
+    # existed, so a single maximize is all that's needed here
     _main_window.setWindowOpacity(1.0)
-    _main_window.showMaximized()  # Maximize window on startup
+    _main_window.showMaximized()
     _main_window.raise_()
     _main_window.activateWindow()
-    
-    # Process events again
-    QApplication.processEvents()
-    
-    print(f"Window shown - Visible: {_main_window.isVisible()}, Opacity: {_main_window.windowOpacity()}")
-    print(f"Window geometry: {_main_window.geometry()}")
-    print(f"Window flags: {_main_window.windowFlags()}")
-    
-    # Verify window is actually visible
-    if not _main_window.isVisible():
-        print("WARNING: Window is not visible after show() call!")
-        _main_window.setVisible(True)
-        _main_window.show()
-        QApplication.processEvents()
 
 
 def fade_in_window():
@@ -1,30 +1,121 @@
 """
 Analytics page for the CRM application
 """
+import io
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QScrollArea, QSizePolicy
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QFont, QPixmap
 
-from database.db import (
-    get_products_by_category, get_inventory_value_by_category,
-    get_waste_by_reason, get_waste_by_item, get_waste_trend,
-    get_assets_by_type, get_assets_by_condition, get_assets_value_by_type
-)
+from database.db import data_version, get_analytics_bundle
 from utils.charts import (
-    create_pie_chart, create_bar_chart, create_line_chart, create_waste_by_reason_chart
+    build_pie_figure, build_bar_figure, build_line_figure,
+    build_waste_by_reason_figure
 )
 
 
+class AnalyticsWorker(QRunnable):
+    """Renders the analytics charts to PNG bytes on a thread-pool thread
+
+    SQL aggregation, matplotlib figure building and Agg rasterization all
+    happen off the GUI thread; the finished slot only loads the PNGs into
+    QPixmaps. Charts whose data hash matches the page's cached hash are
+    skipped entirely (emitted as None), so a write to one table re-renders
+    only the charts fed by it. Emits either a dict keyed by container name,
+    or the exception that interrupted the build.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(object)
+
+    def __init__(self, known_hashes=None, figure_cache=None):
+        super().__init__()
+        self.signals = AnalyticsWorker.Signals()
+        self._known_hashes = known_hashes or {}
+        # Page-owned Figures reused across refreshes, so each redraw reuses
+        # the existing Agg buffer instead of allocating a new one
+        self._figures = figure_cache if figure_cache is not None else {}
+
+    def _render(self, name, data, builder, *args, **kwargs):
+        """Render one chart to (data_hash, png_bytes), or skip if unchanged"""
+        key = hash(tuple(data))
+        if self._known_hashes.get(name) == key:
+            return (key, None)
+        fig = builder(data, *args, fig=self._figures.get(name), **kwargs)
+        self._figures[name] = fig
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=100)
+        return (key, buf.getvalue())
+
+    def run(self):
+        try:
+            bundle = get_analytics_bundle()
+            charts = {
+                "products_category": self._render(
+                    "products_category", bundle["products_by_category"],
+                    build_pie_figure, "Products by Category"),
+                "inventory_value": self._render(
+                    "inventory_value", bundle["inventory_value_by_category"],
+                    build_bar_figure, "Inventory Value by Category",
+                    "Category", "Value ($)", "#16a085", horizontal=True),
+                "waste_reason": self._render(
+                    "waste_reason", bundle["waste_by_reason"],
+                    build_waste_by_reason_figure),
+                "waste_item": self._render(
+                    "waste_item", bundle["waste_by_item"],
+                    build_bar_figure, "Top Wasted Items",
+                    "Item", "Quantity", "#e74c3c", horizontal=True),
+                # Reverse to show chronological order
+                "waste_trend": self._render(
+                    "waste_trend", list(reversed(bundle["waste_trend"])),
+                    build_line_figure, "Waste Trend", "Date", "Quantity"),
+                "assets_type": self._render(
+                    "assets_type", bundle["assets_by_type"],
+                    build_pie_figure, "Assets by Type"),
+                "assets_condition": self._render(
+                    "assets_condition", bundle["assets_by_condition"],
+                    build_pie_figure, "Assets by Condition"),
+                "assets_value": self._render(
+                    "assets_value", bundle["assets_value_by_type"],
+                    build_bar_figure, "Asset Value by Type",
+                    "Type", "Value ($)", "#2ecc71", horizontal=True),
+            }
+            self.signals.finished.emit(charts)
+        except Exception as e:
+            self.signals.finished.emit(e)
+
+
 class AnalyticsPage(QWidget):
     def __init__(self):
         super().__init__()
+        self._seen_version = None
+        # True while an AnalyticsWorker is on the pool; two at once would
+        # race over the shared Figure cache
+        self._rendering = False
+        # Cleared when a background render fails; MainWindow.navigate_to_page
+        # reads it and retries the refresh on the next visit
+        self.refresh_ok = True
+        # Per-chart data hashes; lets the worker skip charts whose inputs
+        # didn't change, and the page reuse their pixmaps
+        self._chart_hashes = {}
+        # Figures handed to the worker for reuse; one per chart slot
+        self._figure_cache = {}
+        # Reusable pixmap labels, one per chart slot
+        self._chart_labels = {}
         self.init_ui()
-        self.refresh()
+        # No refresh here: construction builds chrome only, and
+        # MainWindow.navigate_to_page triggers the first refresh on the
+        # visit that created the page
     
     def init_ui(self):
         """Initialize the analytics UI"""
+        # Chart content goes straight into each frame's layout; slots map
+        # worker figure keys to those layouts, sparing a wrapper QWidget per
+        # chart in the layout tree
+        self._chart_slots = {}
+
         # Create scroll area for better navigation
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -54,16 +145,14 @@ class AnalyticsPage(QWidget):
         
         # Products by Category
         chart_frame1, chart_layout1 = self.create_chart_frame("Products by Category")
-        self.products_category_chart_container = QWidget()
-        self.products_category_chart_container.setMinimumHeight(350)
-        chart_layout1.addWidget(self.products_category_chart_container)
+        chart_frame1.setMinimumHeight(350)
+        self._chart_slots["products_category"] = chart_layout1
         products_charts1.addWidget(chart_frame1, stretch=1)
         
         # Inventory Value by Category
         chart_frame2, chart_layout2 = self.create_chart_frame("Inventory Value by Category")
-        self.inventory_value_chart_container = QWidget()
-        self.inventory_value_chart_container.setMinimumHeight(350)
-        chart_layout2.addWidget(self.inventory_value_chart_container)
+        chart_frame2.setMinimumHeight(350)
+        self._chart_slots["inventory_value"] = chart_layout2
         products_charts1.addWidget(chart_frame2, stretch=1)
         
         layout.addLayout(products_charts1)
@@ -78,16 +167,14 @@ class AnalyticsPage(QWidget):
         
         # Waste by Reason
         chart_frame3, chart_layout3 = self.create_chart_frame("Waste by Reason")
-        self.waste_reason_chart_container = QWidget()
-        self.waste_reason_chart_container.setMinimumHeight(350)
-        chart_layout3.addWidget(self.waste_reason_chart_container)
+        chart_frame3.setMinimumHeight(350)
+        self._chart_slots["waste_reason"] = chart_layout3
         waste_charts1.addWidget(chart_frame3, stretch=1)
         
         # Top Wasted Items
         chart_frame4, chart_layout4 = self.create_chart_frame("Top Wasted Items")
-        self.waste_item_chart_container = QWidget()
-        self.waste_item_chart_container.setMinimumHeight(350)
-        chart_layout4.addWidget(self.waste_item_chart_container)
+        chart_frame4.setMinimumHeight(350)
+        self._chart_slots["waste_item"] = chart_layout4
         waste_charts1.addWidget(chart_frame4, stretch=1)
         
         layout.addLayout(waste_charts1)
@@ -97,9 +184,8 @@ class AnalyticsPage(QWidget):
         waste_charts2.setSpacing(20)
         
         chart_frame5, chart_layout5 = self.create_chart_frame("Waste Trend (Last 7 Days)")
-        self.waste_trend_chart_container = QWidget()
-        self.waste_trend_chart_container.setMinimumHeight(350)
-        chart_layout5.addWidget(self.waste_trend_chart_container)
+        chart_frame5.setMinimumHeight(350)
+        self._chart_slots["waste_trend"] = chart_layout5
         waste_charts2.addWidget(chart_frame5, stretch=1)
         waste_charts2.addStretch()  # Add empty space on the right
         
@@ -115,16 +201,14 @@ class AnalyticsPage(QWidget):
         
         # Assets by Type
         chart_frame6, chart_layout6 = self.create_chart_frame("Assets by Type")
-        self.assets_type_chart_container = QWidget()
-        self.assets_type_chart_container.setMinimumHeight(350)
-        chart_layout6.addWidget(self.assets_type_chart_container)
+        chart_frame6.setMinimumHeight(350)
+        self._chart_slots["assets_type"] = chart_layout6
         assets_charts1.addWidget(chart_frame6, stretch=1)
         
         # Assets by Condition
         chart_frame7, chart_layout7 = self.create_chart_frame("Assets by Condition")
-        self.assets_condition_chart_container = QWidget()
-        self.assets_condition_chart_container.setMinimumHeight(350)
-        chart_layout7.addWidget(self.assets_condition_chart_container)
+        chart_frame7.setMinimumHeight(350)
+        self._chart_slots["assets_condition"] = chart_layout7
         assets_charts1.addWidget(chart_frame7, stretch=1)
         
         layout.addLayout(assets_charts1)
@@ -134,9 +218,8 @@ class AnalyticsPage(QWidget):
         assets_charts2.setSpacing(20)
         
         chart_frame8, chart_layout8 = self.create_chart_frame("Asset Value by Type")
-        self.assets_value_chart_container = QWidget()
-        self.assets_value_chart_container.setMinimumHeight(350)
-        chart_layout8.addWidget(self.assets_value_chart_container)
+        chart_frame8.setMinimumHeight(350)
+        self._chart_slots["assets_value"] = chart_layout8
         assets_charts2.addWidget(chart_frame8, stretch=1)
         assets_charts2.addStretch()  # Add empty space on the right
         
@@ -151,23 +234,16 @@ class AnalyticsPage(QWidget):
         main_layout.addWidget(scroll)
     
     def create_section_header(self, title: str) -> QLabel:
-        """Create a section header label"""
+        """Create a section header label (styled via the application QSS)"""
         header = QLabel(title)
         header.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #34495e; margin-top: 20px; margin-bottom: 10px; padding-top: 10px; border-top: 2px solid #e1e8ed;")
+        header.setObjectName("sectionHeader")
         return header
-    
+
     def create_chart_frame(self, title: str):
-        """Create a chart frame with title"""
+        """Create a chart frame with title (styled via the application QSS)"""
         chart_frame = QFrame()
         chart_frame.setObjectName("chartFrame")
-        chart_frame.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout = QVBoxLayout(chart_frame)
         chart_layout.setContentsMargins(20, 20, 20, 20)
         
@@ -180,100 +256,88 @@ class AnalyticsPage(QWidget):
     
     def refresh(self):
         """Refresh all analytics charts"""
-        # Products charts
-        self.update_products_category_chart()
-        self.update_inventory_value_chart()
-        
-        # Waste charts
-        self.update_waste_reason_chart()
-        self.update_waste_item_chart()
-        self.update_waste_trend_chart()
-        
-        # Assets charts
-        self.update_assets_type_chart()
-        self.update_assets_condition_chart()
-        self.update_assets_value_chart()
-    
-    def update_products_category_chart(self):
-        """Update products by category chart"""
-        data = get_products_by_category()
-        self.update_chart_container(self.products_category_chart_container,
-                                   lambda: create_pie_chart(data, "Products by Category"))
-    
-    def update_inventory_value_chart(self):
-        """Update inventory value by category chart"""
-        data = get_inventory_value_by_category()
-        self.update_chart_container(self.inventory_value_chart_container,
-                                   lambda: create_bar_chart(data, "Inventory Value by Category",
-                                                           "Category", "Value ($)", "#16a085", horizontal=True))
-    
-    def update_waste_reason_chart(self):
-        """Update waste by reason chart"""
-        data = get_waste_by_reason()
-        self.update_chart_container(self.waste_reason_chart_container,
-                                   lambda: create_waste_by_reason_chart(data))
-    
-    def update_waste_item_chart(self):
-        """Update waste by item chart"""
-        data = get_waste_by_item()
-        self.update_chart_container(self.waste_item_chart_container,
-                                   lambda: create_bar_chart(data, "Top Wasted Items",
-                                                           "Item", "Quantity", "#e74c3c", horizontal=True))
-    
-    def update_waste_trend_chart(self):
-        """Update waste trend chart"""
-        data = get_waste_trend()
-        # Reverse to show chronological order
-        data = list(reversed(data))
-        self.update_chart_container(self.waste_trend_chart_container,
-                                   lambda: create_line_chart(data, "Waste Trend", "Date", "Quantity"))
-    
-    def update_assets_type_chart(self):
-        """Update assets by type chart"""
-        data = get_assets_by_type()
-        self.update_chart_container(self.assets_type_chart_container,
-                                   lambda: create_pie_chart(data, "Assets by Type"))
-    
-    def update_assets_condition_chart(self):
-        """Update assets by condition chart"""
-        data = get_assets_by_condition()
-        self.update_chart_container(self.assets_condition_chart_container,
-                                   lambda: create_pie_chart(data, "Assets by Condition"))
-    
-    def update_assets_value_chart(self):
-        """Update asset value by type chart"""
-        data = get_assets_value_by_type()
-        self.update_chart_container(self.assets_value_chart_container,
-                                   lambda: create_bar_chart(data, "Asset Value by Type",
-                                                           "Type", "Value ($)", "#2ecc71", horizontal=True))
-    
-    def update_chart_container(self, container: QWidget, chart_creator):
-        """Update a chart container with a new chart"""
-        layout = container.layout()
-        if layout:
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-        else:
-            layout = QVBoxLayout(container)
-            layout.setContentsMargins(0, 0, 0, 0)
-        
-        try:
-            chart = chart_creator()
-            if chart:
-                layout.addWidget(chart)
-            else:
-                raise ValueError("Chart creator returned None")
-        except Exception as e:
-            # If chart creation fails, show error message with details
+        # Re-rendering 8 matplotlib figures is the expensive part of this
+        # page; skip the whole pass when no table changed since last time
+        # One worker at a time: overlapping workers would both mutate the
+        # shared Figures in _figure_cache from pool threads. A version bump
+        # that lands mid-render is picked up by _on_charts_ready instead.
+        if self._rendering:
+            return
+        version = data_version()
+        if version == self._seen_version:
+            return
+        self._seen_version = version
+        self._rendering = True
+
+        # SQL + chart rasterization run on the thread pool; pixmaps are
+        # attached in _on_charts_ready once the worker signals back
+        worker = AnalyticsWorker(dict(self._chart_hashes), self._figure_cache)
+        worker.signals.finished.connect(self._on_charts_ready)
+        self._worker = worker  # keep a reference while it runs
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_charts_ready(self, result):
+        """Load the worker's PNGs into pixmap labels (GUI thread)"""
+        self._rendering = False
+        if isinstance(result, Exception):
             import traceback
-            error_msg = f"Unable to load chart\n{str(e)}"
-            print(f"Chart error: {error_msg}")
-            print(traceback.format_exc())
-            error_label = QLabel(error_msg)
-            error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            error_label.setWordWrap(True)
-            error_label.setStyleSheet("color: #e74c3c; padding: 20px; font-size: 11px;")
-            layout.addWidget(error_label)
+            print(f"Chart error: {result}")
+            traceback.print_exception(result)
+            for name in self._chart_slots:
+                self._show_chart_error(name, result)
+            # Force a full re-render on the next refresh: drop the hashes
+            # and the seen version, otherwise a transient failure would
+            # leave the error labels up until an unrelated write
+            self._chart_hashes.clear()
+            self._seen_version = None
+            self.refresh_ok = False
+            return
+        self.refresh_ok = True
+
+        for name in self._chart_slots:
+            key, png = result.get(name, (None, None))
+            if png is None:
+                # Data unchanged since last render; the existing pixmap stays
+                continue
+            pixmap = QPixmap()
+            pixmap.loadFromData(png)
+            self._chart_hashes[name] = key
+            self._set_chart_pixmap(name, pixmap)
+
+        # A write may have landed while the worker was rendering; run one
+        # more pass now that the in-flight guard is released
+        if data_version() != self._seen_version:
+            self.refresh()
+
+    def _clear_slot(self, name: str):
+        """Remove a slot's chart content, keeping its title label"""
+        layout = self._chart_slots[name]
+        while layout.count() > 1:
+            item = layout.takeAt(1)
+            w = item.widget()
+            if w is not None:
+                w.setParent(None)
+                w.deleteLater()
+
+    def _set_chart_pixmap(self, name: str, pixmap: QPixmap):
+        """Show a rendered chart on the slot's reusable label"""
+        label = self._chart_labels.get(name)
+        if label is None:
+            # Drop whatever was there before (e.g. an error label)
+            self._clear_slot(name)
+            label = QLabel()
+            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            label.setMinimumHeight(350)
+            self._chart_labels[name] = label
+            self._chart_slots[name].addWidget(label)
+        label.setPixmap(pixmap)
 
+    def _show_chart_error(self, name: str, error: Exception):
+        """Replace a slot's chart content with an error message"""
+        self._clear_slot(name)
+        self._chart_labels[name] = None
+        error_label = QLabel(f"Unable to load chart\n{str(error)}")
+        error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        error_label.setWordWrap(True)
+        error_label.setStyleSheet("color: #e74c3c; padding: 20px; font-size: 11px;")
+        self._chart_slots[name].addWidget(error_label)
@@ -1,60 +1,205 @@
 """
 Assets page for the CRM application
 """
+import bisect
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
-    QTableWidgetItem, QLineEdit, QDialog, QFormLayout, QMessageBox,
-    QHeaderView, QAbstractItemView, QDateEdit, QComboBox, QFrame, QScrollArea, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView,
+    QLineEdit, QDialog, QFormLayout, QMessageBox,
+    QHeaderView, QAbstractItemView, QDateEdit, QComboBox, QFrame, QScrollArea,
+    QSizePolicy, QStyledItemDelegate, QCheckBox
+)
+from PyQt6.QtCore import (
+    Qt, QDate, QSize, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, QLocale
 )
-from PyQt6.QtCore import Qt, QDate, QSize
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QDoubleValidator
 from utils.icons import get_icon, create_icon_button
 
 from database.db import (
-    get_all_assets, add_asset, update_asset, delete_asset, get_asset,
-    get_total_asset_value, get_average_asset_value, get_assets_by_type,
-    get_assets_by_condition
+    get_all_assets, add_asset, add_assets_bulk, update_asset, delete_assets_bulk,
+    get_asset, get_assets_summary
 )
 from utils.helpers import (
     show_error_message, show_success_message, show_confirm_dialog,
-    validate_number, export_to_csv, export_to_excel
+    write_csv, write_excel
 )
 
 
+# Fonts and stylesheets shared by every AssetsPage/AssetDialog instance;
+# built once at import so reconstruction never re-parses them
+_TITLE_FONT = QFont("Segoe UI", 20, QFont.Weight.Bold)
+_CARD_TITLE_FONT = QFont("Segoe UI", 9)
+_CARD_VALUE_FONT = QFont("Segoe UI", 22, QFont.Weight.Bold)
+
+_DIALOG_QSS = """
+    QDialog {
+        background-color: white;
+    }
+    QLabel {
+        color: #2c3e50;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QLineEdit, QDateEdit, QComboBox {
+        padding: 8px 12px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-size: 13px;
+        background-color: white;
+    }
+    QLineEdit:focus, QDateEdit:focus, QComboBox:focus {
+        border: 2px solid #3498db;
+    }
+    QPushButton {
+        padding: 8px 20px;
+        border-radius: 4px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+"""
+
+_BTN_SAVE_QSS = """
+    QPushButton {
+        background-color: #27ae60;
+        color: white;
+    }
+    QPushButton:hover {
+        background-color: #229954;
+    }
+"""
+
+_BTN_CANCEL_QSS = """
+    QPushButton {
+        background-color: #95a5a6;
+        color: white;
+    }
+    QPushButton:hover {
+        background-color: #7f8c8d;
+    }
+"""
+
+_SEARCH_QSS = """
+    QLineEdit {
+        padding: 8px 12px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        font-size: 13px;
+        background-color: white;
+    }
+    QLineEdit:focus {
+        border: 2px solid #3498db;
+    }
+"""
+
+_BTN_ADD_QSS = """
+    QPushButton {
+        background-color: #9b59b6;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #8e44ad;
+    }
+"""
+
+_BTN_IMPORT_QSS = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+_BTN_EXPORT_CSV_QSS = """
+    QPushButton {
+        background-color: #95a5a6;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #7f8c8d;
+    }
+"""
+
+_BTN_EXPORT_EXCEL_QSS = """
+    QPushButton {
+        background-color: #16a085;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #138d75;
+    }
+"""
+
+_TABLE_QSS = """
+    QTableView {
+        background-color: white;
+        border: 1px solid #e1e8ed;
+        border-radius: 6px;
+        gridline-color: #f0f0f0;
+        font-size: 13px;
+    }
+    QTableView::item {
+        padding: 8px;
+        border: none;
+    }
+    QTableView::item:selected {
+        background-color: #3498db;
+        color: white;
+    }
+    QHeaderView::section {
+        background-color: #f8f9fa;
+        padding: 10px;
+        border: none;
+        border-bottom: 2px solid #e1e8ed;
+        font-weight: 600;
+        font-size: 12px;
+        color: #2c3e50;
+    }
+"""
+
+_CARD_QSS = """
+    QFrame#summaryCard {{
+        background-color: white;
+        border-radius: 8px;
+        border: 1px solid #e1e8ed;
+    }}
+    QFrame#summaryCard:hover {{
+        border: 2px solid {color};
+        box-shadow: 0px 2px 8px rgba(0, 0, 0, 0.1);
+    }}
+"""
+
+
 class AssetDialog(QDialog):
     """Dialog for adding/editing assets"""
     def __init__(self, parent=None, asset_id=None):
         super().__init__(parent)
         self.asset_id = asset_id
-        self.setWindowTitle("Edit Asset" if asset_id else "Add Asset")
         self.setModal(True)
         self.setFixedWidth(420)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: white;
-            }
-            QLabel {
-                color: #2c3e50;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            QLineEdit, QDateEdit, QComboBox {
-                padding: 8px 12px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-                background-color: white;
-            }
-            QLineEdit:focus, QDateEdit:focus, QComboBox:focus {
-                border: 2px solid #3498db;
-            }
-            QPushButton {
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         layout = QFormLayout(self)
         layout.setSpacing(15)
@@ -69,6 +214,11 @@ class AssetDialog(QDialog):
         self.date_input.setDate(QDate.currentDate())
         self.date_input.setDisplayFormat("yyyy-MM-dd")
         self.value_input = QLineEdit()
+        # Reject invalid characters at the keystroke, so the save handlers
+        # can parse with a bare float()
+        validator = QDoubleValidator(0.0, 1e12, 2, self)
+        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        self.value_input.setValidator(validator)
         self.condition_input = QComboBox()
         self.condition_input.addItems(["Excellent", "Good", "Fair", "Poor"])
         
@@ -82,38 +232,33 @@ class AssetDialog(QDialog):
         buttons.setSpacing(10)
         
         btn_save = create_icon_button("Save", "save")
-        btn_save.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """)
+        btn_save.setStyleSheet(_BTN_SAVE_QSS)
         btn_save.clicked.connect(self.accept)
         
         btn_cancel = create_icon_button("Cancel", "cancel")
-        btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        btn_cancel.setStyleSheet(_BTN_CANCEL_QSS)
         btn_cancel.clicked.connect(self.reject)
         
         buttons.addStretch()
         buttons.addWidget(btn_save)
         buttons.addWidget(btn_cancel)
         layout.addRow(buttons)
-        
-        # Load existing data if editing
+
+        self.reset(asset_id)
+
+    def reset(self, asset_id=None):
+        """Prepare the dialog for another add/edit round without rebuilding it"""
+        self.asset_id = asset_id
+        self.setWindowTitle("Edit Asset" if asset_id else "Add Asset")
         if asset_id:
             self.load_asset()
-    
+        else:
+            self.name_input.clear()
+            self.type_input.setCurrentIndex(0)
+            self.date_input.setDate(QDate.currentDate())
+            self.value_input.clear()
+            self.condition_input.setCurrentIndex(0)
+
     def load_asset(self):
         """Load asset data into form"""
         asset = get_asset(self.asset_id)
@@ -136,14 +281,270 @@ class AssetDialog(QDialog):
         }
 
 
+# The app displays US-dollar amounts regardless of the system locale
+_LOCALE = QLocale(QLocale.Language.English, QLocale.Country.UnitedStates)
+
+
+class CurrencyDelegate(QStyledItemDelegate):
+    """Formats raw float values as currency only when a cell is painted"""
+
+    def displayText(self, value, locale):
+        # Qt's C++ formatter; no Python format-spec parsing per cell
+        return _LOCALE.toCurrencyString(float(value))
+
+
+class AssetTableModel(QAbstractTableModel):
+    """
+    Read-only table model wrapping the asset rows returned by the database.
+
+    The view only asks for the rows it actually paints, so a refresh is one
+    model reset instead of rows x columns item allocations.
+    """
+
+    HEADERS = ("ID", "Name", "Type", "Purchase Date", "Value", "Condition")
+
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows or []
+        # One lowercase searchable string per row, built once per data load
+        self._blobs = self._build_blobs(self._rows)
+
+    @staticmethod
+    def _build_blobs(rows):
+        return [
+            (r['name'] + '\x1f' + (r['type'] or '') + '\x1f' + (r['condition'] or '')).lower()
+            for r in rows
+        ]
+
+    def search_blob(self, row):
+        """Return the precomputed lowercase search string for a row"""
+        return self._blobs[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.UserRole:
+            # Integer asset id, for selection handlers; never round-trips
+            # through the displayed text
+            return self._rows[index.row()]['id']
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            # Center the ID and Value columns, as the old per-item pass did
+            if index.column() in (0, 4):
+                return Qt.AlignmentFlag.AlignCenter
+            return Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        asset = self._rows[index.row()]
+        col = index.column()
+        if col == 0:
+            return str(asset['id'])
+        if col == 1:
+            return asset['name']
+        if col == 2:
+            return asset['type'] or ''
+        if col == 3:
+            return asset['purchase_date'] or ''
+        if col == 4:
+            # Raw float; the CurrencyDelegate formats it at paint time
+            return asset['value']
+        if col == 5:
+            return asset['condition'] or ''
+        return None
+
+    def asset_at(self, row):
+        """Return the underlying asset row for a view row"""
+        return self._rows[row]
+
+    def rows(self):
+        """Return the backing asset rows"""
+        return self._rows
+
+    def set_rows(self, rows):
+        """Replace the backing rows in one model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self._blobs = self._build_blobs(rows)
+        self.endResetModel()
+
+    def insert_row(self, asset):
+        """Insert one asset, keeping the name order the backing query uses"""
+        row = bisect.bisect_left([r['name'] for r in self._rows], asset['name'])
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, asset)
+        self._blobs.insert(row, self._build_blobs([asset])[0])
+        self.endInsertRows()
+
+    def update_row(self, row, asset):
+        """Replace one asset in place, re-sorting only if its name changed"""
+        if asset['name'] != self._rows[row]['name']:
+            self.remove_row(row)
+            self.insert_row(asset)
+            return
+        self._rows[row] = asset
+        self._blobs[row] = self._build_blobs([asset])[0]
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def remove_row(self, row):
+        """Remove one asset row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._blobs[row]
+        self.endRemoveRows()
+
+
+class ExportWorker(QRunnable):
+    """
+    Writes an asset export file off the GUI thread.
+
+    The worker is handed the asset rows the page already holds, so an
+    export costs no extra database round-trip; it only reads plain row
+    data, so running off-thread is safe. Results come back on the GUI
+    thread via a queued signal.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(bool, object)  # success, error (None on success)
+
+    HEADERS = ['ID', 'Name', 'Type', 'Purchase Date', 'Value', 'Condition']
+
+    def __init__(self, file_path, format_type, assets):
+        super().__init__()
+        self.file_path = file_path
+        self.format_type = format_type
+        self.assets = assets
+        self.signals = ExportWorker.Signals()
+
+    def run(self):
+        try:
+            rows = (
+                (a['id'], a['name'], a['type'] or '',
+                 a['purchase_date'] or '', a['value'], a['condition'] or '')
+                for a in self.assets
+            )
+            if self.format_type == 'csv':
+                write_csv(self.file_path, rows, self.HEADERS)
+            else:
+                write_excel(self.file_path, rows, self.HEADERS)
+            self.signals.finished.emit(True, None)
+        except Exception as e:
+            self.signals.finished.emit(False, e)
+
+
+class RefreshWorker(QRunnable):
+    """
+    Fetches the asset rows and summary off the GUI thread.
+
+    Same pattern as ExportWorker: the shared database connection is safe
+    to read from the pool thread, and the result lands back on the GUI
+    thread through a queued signal.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(object)  # dict of results, or an Exception
+
+    def __init__(self):
+        super().__init__()
+        self.signals = RefreshWorker.Signals()
+
+    def run(self):
+        try:
+            self.signals.finished.emit({
+                'assets': get_all_assets(),
+                'summary': get_assets_summary(),
+            })
+        except Exception as e:
+            self.signals.finished.emit(e)
+
+
+class AssetFilterProxy(QSortFilterProxyModel):
+    """
+    Filter proxy that remembers which source rows the previous query matched.
+
+    When the user narrows a search ("a" -> "ab" -> "abc") the new result set
+    is a subset of the old one, so rows the shorter query already rejected
+    are dropped without re-running the string match. Rows are matched
+    against the lowercase blobs the model precomputes, one substring test
+    per row instead of lowering three fields per keystroke.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+        self._needle = ""
+        self._accepted = set()
+        self._prev_accepted = None
+        # Only a full filter pass leaves _accepted trustworthy; row
+        # inserts/removes shift source indices and invalidate it
+        self._complete = False
+
+    def set_query(self, text):
+        """Apply a new filter string, reusing the last result when narrowing"""
+        narrowing = self._complete and bool(self._query) and text.startswith(self._query)
+        self._prev_accepted = self._accepted if narrowing else None
+        self._query = text
+        self._needle = text.lower()
+        self._accepted = set()
+        self.invalidateFilter()
+        self._complete = True
+
+    def reset_cache(self):
+        """Drop cached row sets; call before the source rows change"""
+        self._accepted = set()
+        self._prev_accepted = None
+        self._complete = False
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._prev_accepted is not None and source_row not in self._prev_accepted:
+            return False
+        accepted = not self._needle or self._needle in self.sourceModel().search_blob(source_row)
+        if accepted:
+            self._accepted.add(source_row)
+        return accepted
+
+
 class AssetsPage(QWidget):
     def __init__(self):
         super().__init__()
+        self._dialog = None  # single AssetDialog, reused across opens
+        self._refreshing = False
+        # Cleared when a background refresh fails; MainWindow.navigate_to_page
+        # reads it and retries the refresh on the next visit
+        self.refresh_ok = True
         self.init_ui()
         self.refresh()
+
+    def _asset_dialog(self, asset_id=None):
+        """Return the shared AssetDialog, reset for the given asset"""
+        if self._dialog is None:
+            self._dialog = AssetDialog(self)
+        self._dialog.reset(asset_id)
+        return self._dialog
     
     def init_ui(self):
         """Initialize the assets UI"""
+        # Model + proxy pair; the proxy filters in C++ so searching never
+        # rebuilds the table from Python
+        self._model = AssetTableModel(parent=self)
+        self.proxy = AssetFilterProxy(self)
+        self.proxy.setSourceModel(self._model)
+
+        # Debounce timer: restart on each keystroke, filter once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(180)
+        self._search_timer.timeout.connect(self._apply_search)
+
         # Create scroll area for better navigation
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -161,7 +562,7 @@ class AssetsPage(QWidget):
         header = QHBoxLayout()
         
         title = QLabel("Assets Management")
-        title.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         title.setStyleSheet("color: #2c3e50;")
         header.addWidget(title)
         
@@ -173,77 +574,40 @@ class AssetsPage(QWidget):
         self.search_input.setMaximumWidth(300)
         self.search_input.setMinimumWidth(200)
         self.search_input.setFixedHeight(35)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 8px 12px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                font-size: 13px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3498db;
-            }
-        """)
-        self.search_input.textChanged.connect(self.filter_table)
+        self.search_input.setStyleSheet(_SEARCH_QSS)
+        self.search_input.textChanged.connect(self._search_timer.start)
         header.addWidget(self.search_input)
         
         # Action buttons with icons
         btn_add = create_icon_button("Add Asset", "add")
         btn_add.setFixedHeight(35)
-        btn_add.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-        """)
+        btn_add.setStyleSheet(_BTN_ADD_QSS)
         btn_add.clicked.connect(self.add_asset)
-        
+
+        btn_bulk_import = create_icon_button("Bulk Import", "import")
+        btn_bulk_import.setFixedHeight(35)
+        btn_bulk_import.setStyleSheet(_BTN_IMPORT_QSS)
+        btn_bulk_import.clicked.connect(self.bulk_import)
+
+
         btn_export_csv = create_icon_button("Export CSV", "export")
         btn_export_csv.setFixedHeight(35)
-        btn_export_csv.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        btn_export_csv.setStyleSheet(_BTN_EXPORT_CSV_QSS)
         btn_export_csv.clicked.connect(lambda: self.export_data('csv'))
         
         btn_export_excel = create_icon_button("Export Excel", "export")
         btn_export_excel.setFixedHeight(35)
-        btn_export_excel.setStyleSheet("""
-            QPushButton {
-                background-color: #16a085;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #138d75;
-            }
-        """)
+        btn_export_excel.setStyleSheet(_BTN_EXPORT_EXCEL_QSS)
         btn_export_excel.clicked.connect(lambda: self.export_data('excel'))
         
+        # Export only the rows the current search shows, straight from the
+        # proxy — no extra database query either way
+        self.export_filtered_check = QCheckBox("Export filtered view only")
+        self.export_filtered_check.setStyleSheet("color: #2c3e50; font-size: 12px;")
+
         header.addWidget(btn_add)
+        header.addWidget(btn_bulk_import)
+        header.addWidget(self.export_filtered_check)
         header.addWidget(btn_export_csv)
         header.addWidget(btn_export_excel)
         
@@ -266,40 +630,23 @@ class AssetsPage(QWidget):
         layout.addLayout(summary_layout)
         
         # Table with professional styling - set max height so it scrolls internally
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Type", "Purchase Date", "Value", "Condition"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        # Stretching every column makes Qt recompute all widths whenever the
+        # row set changes; give fixed columns a width once and let Name
+        # absorb the spare space
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        for col, width in ((0, 60), (2, 130), (3, 140), (4, 120), (5, 120)):
+            self.table.setColumnWidth(col, width)
+        self.table.setItemDelegateForColumn(4, CurrencyDelegate(self.table))
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setMaximumHeight(400)  # Set max height so table scrolls internally
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 6px;
-                gridline-color: #f0f0f0;
-                font-size: 13px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border: none;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #f8f9fa;
-                padding: 10px;
-                border: none;
-                border-bottom: 2px solid #e1e8ed;
-                font-weight: 600;
-                font-size: 12px;
-                color: #2c3e50;
-            }
-        """)
+        self.table.setStyleSheet(_TABLE_QSS)
         
         # Context menu for edit/delete
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -319,30 +666,20 @@ class AssetsPage(QWidget):
         card.setObjectName("summaryCard")
         card.setFixedHeight(100)
         card.setMinimumWidth(150)
-        card.setStyleSheet(f"""
-            QFrame#summaryCard {{
-                background-color: white;
-                border-radius: 8px;
-                border: 1px solid #e1e8ed;
-            }}
-            QFrame#summaryCard:hover {{
-                border: 2px solid {color};
-                box-shadow: 0px 2px 8px rgba(0, 0, 0, 0.1);
-            }}
-        """)
+        card.setStyleSheet(_CARD_QSS.format(color=color))
         
         layout = QVBoxLayout(card)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(8)
         
         title_label = QLabel(title)
-        title_label.setFont(QFont("Segoe UI", 9))
+        title_label.setFont(_CARD_TITLE_FONT)
         title_label.setStyleSheet("color: #7f8c8d; font-weight: 500;")
         title_label.setWordWrap(True)
         layout.addWidget(title_label)
         
         value_label = QLabel(value)
-        value_label.setFont(QFont("Segoe UI", 22, QFont.Weight.Bold))
+        value_label.setFont(_CARD_VALUE_FONT)
         value_label.setStyleSheet(f"color: {color};")
         value_label.setObjectName("valueLabel")
         value_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
@@ -350,22 +687,57 @@ class AssetsPage(QWidget):
         
         return card
     
+    def _apply_search(self):
+        """Apply the pending search text once the debounce timer fires"""
+        self.proxy.set_query(self.search_input.text())
+
     def refresh(self):
-        """Refresh assets table"""
-        assets = get_all_assets()
-        self.all_assets = assets
-        self.populate_table(assets)
-        
-        # Update summary cards
-        total_value = get_total_asset_value()
-        avg_value = get_average_asset_value()
-        types_data = get_assets_by_type()
-        conditions_data = get_assets_by_condition()
-        
-        self.update_card_value(self.total_value_card, f"${total_value:,.2f}")
-        self.update_card_value(self.avg_value_card, f"${avg_value:,.2f}")
-        self.update_card_value(self.types_card, str(len(types_data)))
-        self.update_card_value(self.conditions_card, str(len(conditions_data)))
+        """
+        Refresh assets table and summary cards.
+
+        The database reads run on the thread pool; _apply_refresh updates
+        the widgets on the GUI thread once the data lands. Overlapping
+        requests are collapsed into the one already in flight.
+        """
+        if self._refreshing:
+            return
+        self._refreshing = True
+        worker = RefreshWorker()
+        worker.signals.finished.connect(self._apply_refresh)
+        self._refresh_worker = worker  # keep the signal holder alive
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_refresh(self, result):
+        """Apply freshly fetched rows and summary to the widgets"""
+        self._refreshing = False
+        if isinstance(result, Exception):
+            print(f"Failed to refresh assets: {result}")
+            # Flag the failure so navigate_to_page retries on the next
+            # visit instead of trusting its recorded page version
+            self.refresh_ok = False
+            return
+        self.refresh_ok = True
+
+        # Suppress painting until the table reset and all four summary
+        # cards have new values, so the page repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            self.proxy.reset_cache()
+            self._model.set_rows(result['assets'])
+            self._apply_summary(result['summary'])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _refresh_summary(self):
+        """Re-query the single-scan assets summary and update the cards"""
+        self._apply_summary(get_assets_summary())
+
+    def _apply_summary(self, summary):
+        """Write summary values into the four cards"""
+        self.update_card_value(self.total_value_card, f"${summary['total_value']:,.2f}")
+        self.update_card_value(self.avg_value_card, f"${summary['avg_value']:,.2f}")
+        self.update_card_value(self.types_card, str(summary['types']))
+        self.update_card_value(self.conditions_card, str(summary['conditions']))
     
     def update_card_value(self, card: QFrame, value: str):
         """Update the value in a summary card"""
@@ -373,115 +745,165 @@ class AssetsPage(QWidget):
         if value_label:
             value_label.setText(value)
     
-    def populate_table(self, assets):
-        """Populate table with assets"""
-        self.table.setRowCount(len(assets))
-        
-        for row, asset in enumerate(assets):
-            self.table.setItem(row, 0, QTableWidgetItem(str(asset['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(asset['name']))
-            self.table.setItem(row, 2, QTableWidgetItem(asset['type'] or ''))
-            self.table.setItem(row, 3, QTableWidgetItem(asset['purchase_date'] or ''))
-            self.table.setItem(row, 4, QTableWidgetItem(f"${asset['value']:,.2f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(asset['condition'] or ''))
-            
-            # Center align ID and value
-            for col in [0, 4]:
-                item = self.table.item(row, col)
-                if item:
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-    
-    def filter_table(self):
-        """Filter table based on search input"""
-        search_text = self.search_input.text().lower()
-        
-        if not search_text:
-            self.populate_table(self.all_assets)
-            return
-        
-        filtered = [
-            a for a in self.all_assets
-            if search_text in a['name'].lower() or
-               search_text in (a['type'] or '').lower() or
-               search_text in (a['condition'] or '').lower()
-        ]
-        self.populate_table(filtered)
-    
     def add_asset(self):
         """Add a new asset"""
-        dialog = AssetDialog(self)
+        dialog = self._asset_dialog()
         if dialog.exec():
             data = dialog.get_data()
             
             if not data['name']:
                 show_error_message(self, "Validation Error", "Asset name is required")
                 return
-            
-            valid_value, value = validate_number(data['value'], "Value")
-            
-            if not valid_value:
+
+            # The dialog's QDoubleValidator only lets a parseable number through
+            try:
+                value = float(data['value'])
+            except ValueError:
                 show_error_message(self, "Validation Error", "Invalid value")
                 return
-            
+
             try:
-                add_asset(data['name'], data['type'], data['date'], value, data['condition'])
+                new_id = add_asset(data['name'], data['type'], data['date'], value, data['condition'])
+                self.proxy.reset_cache()
+                self._model.insert_row({
+                    'id': new_id,
+                    'name': data['name'],
+                    'type': data['type'],
+                    'purchase_date': data['date'],
+                    'value': value,
+                    'condition': data['condition'],
+                })
+                self._refresh_summary()
                 show_success_message(self, "Success", "Asset added successfully")
-                self.refresh()
             except Exception as e:
                 show_error_message(self, "Error", f"Failed to add asset: {str(e)}")
     
+    def bulk_import(self):
+        """
+        Import assets from a CSV file.
+
+        All rows go into the database in a single transaction via
+        add_assets_bulk, with one refresh at the end, instead of one
+        insert-plus-refresh per asset.
+        """
+        import csv
+        from PyQt6.QtWidgets import QFileDialog
+
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Import Assets from CSV", "", "CSV Files (*.csv);;All Files (*)")
+        if not file_path:
+            return
+
+        try:
+            with open(file_path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                if not reader.fieldnames or 'Name' not in reader.fieldnames:
+                    show_error_message(self, "Import Error",
+                                       "CSV file must have a 'Name' column")
+                    return
+
+                rows = []
+                for record in reader:
+                    name = (record.get('Name') or '').strip()
+                    if not name:
+                        continue
+                    try:
+                        value = float(record.get('Value') or 0)
+                    except ValueError:
+                        value = 0.0
+                    rows.append((
+                        name,
+                        (record.get('Type') or '').strip(),
+                        (record.get('Purchase Date') or '').strip(),
+                        value,
+                        (record.get('Condition') or '').strip() or 'Good',
+                    ))
+        except Exception as e:
+            show_error_message(self, "Import Error", f"Failed to read CSV: {str(e)}")
+            return
+
+        if not rows:
+            show_error_message(self, "Import Error", "No importable rows found")
+            return
+
+        try:
+            add_assets_bulk(rows)
+            show_success_message(self, "Success", f"Imported {len(rows)} assets successfully")
+            self.refresh()
+        except Exception as e:
+            show_error_message(self, "Error", f"Failed to import assets: {str(e)}")
+
     def edit_asset(self):
         """Edit selected asset"""
-        selected = self.table.selectedItems()
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             show_error_message(self, "No Selection", "Please select an asset to edit")
             return
-        
-        asset_id = int(self.table.item(selected[0].row(), 0).text())
-        dialog = AssetDialog(self, asset_id)
-        
+
+        source_row = self.proxy.mapToSource(selected[0]).row()
+        asset_id = selected[0].data(Qt.ItemDataRole.UserRole)
+        dialog = self._asset_dialog(asset_id)
+
         if dialog.exec():
             data = dialog.get_data()
             
             if not data['name']:
                 show_error_message(self, "Validation Error", "Asset name is required")
                 return
-            
-            valid_value, value = validate_number(data['value'], "Value")
-            
-            if not valid_value:
+
+            try:
+                value = float(data['value'])
+            except ValueError:
                 show_error_message(self, "Validation Error", "Invalid value")
                 return
-            
+
             try:
                 update_asset(asset_id, data['name'], data['type'], data['date'], value, data['condition'])
+                self.proxy.reset_cache()
+                self._model.update_row(source_row, {
+                    'id': asset_id,
+                    'name': data['name'],
+                    'type': data['type'],
+                    'purchase_date': data['date'],
+                    'value': value,
+                    'condition': data['condition'],
+                })
+                self._refresh_summary()
                 show_success_message(self, "Success", "Asset updated successfully")
-                self.refresh()
             except Exception as e:
                 show_error_message(self, "Error", f"Failed to update asset: {str(e)}")
     
     def delete_asset_action(self):
-        """Delete selected asset"""
-        selected = self.table.selectedItems()
+        """Delete the selected assets in one statement"""
+        selected = self.table.selectionModel().selectedRows()
         if not selected:
             show_error_message(self, "No Selection", "Please select an asset to delete")
             return
-        
-        asset_id = int(self.table.item(selected[0].row(), 0).text())
-        asset_name = self.table.item(selected[0].row(), 1).text()
-        
-        if show_confirm_dialog(self, "Confirm Delete", 
-                              f"Are you sure you want to delete '{asset_name}'?"):
+
+        source_rows = sorted(self.proxy.mapToSource(index).row() for index in selected)
+        asset_ids = [self._model.asset_at(row)['id'] for row in source_rows]
+
+        if len(asset_ids) == 1:
+            prompt = f"Are you sure you want to delete '{selected[0].siblingAtColumn(1).data()}'?"
+        else:
+            prompt = f"Are you sure you want to delete {len(asset_ids)} assets?"
+
+        if show_confirm_dialog(self, "Confirm Delete", prompt):
             try:
-                delete_asset(asset_id)
-                show_success_message(self, "Success", "Asset deleted successfully")
-                self.refresh()
+                delete_assets_bulk(asset_ids)
+                self.proxy.reset_cache()
+                # Remove bottom-up so earlier removals don't shift later rows
+                for row in reversed(source_rows):
+                    self._model.remove_row(row)
+                self._refresh_summary()
+                show_success_message(self, "Success", "Assets deleted successfully"
+                                     if len(asset_ids) > 1 else "Asset deleted successfully")
             except Exception as e:
-                show_error_message(self, "Error", f"Failed to delete asset: {str(e)}")
+                show_error_message(self, "Error", f"Failed to delete assets: {str(e)}")
     
     def show_context_menu(self, position):
         """Show context menu for table"""
-        if self.table.itemAt(position) is None:
+        if not self.table.indexAt(position).isValid():
             return
         
         from PyQt6.QtWidgets import QMenu
@@ -500,28 +922,42 @@ class AssetsPage(QWidget):
             self.delete_asset_action()
     
     def export_data(self, format_type: str):
-        """Export assets data"""
-        assets = get_all_assets()
-        
-        # Convert to list of dicts for export
-        export_data = [
-            {
-                'ID': a['id'],
-                'Name': a['name'],
-                'Type': a['type'] or '',
-                'Purchase Date': a['purchase_date'] or '',
-                'Value': a['value'],
-                'Condition': a['condition'] or ''
-            }
-            for a in assets
-        ]
-        
-        headers = ['ID', 'Name', 'Type', 'Purchase Date', 'Value', 'Condition']
-        
+        """
+        Export assets data on a worker thread.
+
+        Exports the rows the page already holds — every asset, or just the
+        current search result when "Export filtered view only" is checked —
+        so no second database query is needed.
+        """
+        from PyQt6.QtWidgets import QFileDialog
+
         if format_type == 'csv':
-            if export_to_csv(export_data, headers, self):
-                show_success_message(self, "Success", "Data exported to CSV successfully")
-        elif format_type == 'excel':
-            if export_to_excel(export_data, headers, self):
-                show_success_message(self, "Success", "Data exported to Excel successfully")
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "Export to CSV", "", "CSV Files (*.csv);;All Files (*)")
+        else:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "Export to Excel", "", "Excel Files (*.xlsx);;All Files (*)")
+
+        if not file_path:
+            return
+
+        if self.export_filtered_check.isChecked():
+            assets = [
+                self._model.asset_at(self.proxy.mapToSource(self.proxy.index(r, 0)).row())
+                for r in range(self.proxy.rowCount())
+            ]
+        else:
+            assets = self._model.rows()
+
+        worker = ExportWorker(file_path, format_type, assets)
+        worker.signals.finished.connect(self._on_export_done)
+        self._export_worker = worker  # keep the signal holder alive
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_export_done(self, success: bool, error):
+        """Report the export result once the worker finishes"""
+        if success:
+            show_success_message(self, "Success", "Data exported successfully")
+        else:
+            show_error_message(self, "Export Error", f"Failed to export data: {error}")
 
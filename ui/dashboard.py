@@ -1,26 +1,46 @@
 """
 Dashboard page for the CRM application
 """
+import functools
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout, QScrollArea
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QPainter, QPixmap
 
 from database.db import (
-    get_products_count, get_total_waste_quantity, get_total_asset_value, get_waste_by_reason,
-    get_total_inventory_value, get_average_product_price, get_low_stock_products,
-    get_products_by_category, get_inventory_value_by_category, get_waste_by_item,
-    get_waste_trend, get_assets_by_type, get_assets_value_by_type, get_average_asset_value
+    get_dashboard_snapshot, get_waste_by_reason, get_low_stock_products,
+    get_products_by_category, get_inventory_value_by_category,
+    get_waste_trend, get_assets_by_type, get_assets_value_by_type
 )
 from utils.charts import (
-    create_waste_by_reason_chart, create_pie_chart, create_bar_chart, create_line_chart
+    build_waste_by_reason_figure, build_pie_figure, build_bar_figure, build_line_figure
 )
 
 
+@functools.lru_cache(maxsize=16)
+def _emoji_pixmap(char: str, size: int = 24) -> QPixmap:
+    """Render an emoji glyph to a pixmap once per character
+
+    Emoji text in a QLabel goes through the platform text shaper and
+    color-emoji font fallback on every repaint; a cached bitmap blits the
+    same pixels without reshaping.
+    """
+    pix = QPixmap(size, size)
+    pix.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pix)
+    painter.setFont(QFont("Segoe UI", int(size * 0.65)))
+    painter.drawText(pix.rect(), Qt.AlignmentFlag.AlignCenter, char)
+    painter.end()
+    return pix
+
+
 class DashboardPage(QWidget):
     def __init__(self):
         super().__init__()
+        # One persistent canvas per chart container, reused across refreshes
+        self._chart_canvases = {}
         self.init_ui()
         self.refresh()
     
@@ -81,13 +101,6 @@ class DashboardPage(QWidget):
         # Products by Category (Pie Chart)
         chart_frame1 = QFrame()
         chart_frame1.setObjectName("chartFrame")
-        chart_frame1.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout1 = QVBoxLayout(chart_frame1)
         chart_layout1.setContentsMargins(20, 20, 20, 20)
         
@@ -103,13 +116,6 @@ class DashboardPage(QWidget):
         # Inventory Value by Category
         chart_frame2 = QFrame()
         chart_frame2.setObjectName("chartFrame")
-        chart_frame2.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout2 = QVBoxLayout(chart_frame2)
         chart_layout2.setContentsMargins(20, 20, 20, 20)
         
@@ -133,13 +139,6 @@ class DashboardPage(QWidget):
         # Waste by Reason
         chart_frame3 = QFrame()
         chart_frame3.setObjectName("chartFrame")
-        chart_frame3.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout3 = QVBoxLayout(chart_frame3)
         chart_layout3.setContentsMargins(20, 20, 20, 20)
         
@@ -155,13 +154,6 @@ class DashboardPage(QWidget):
         # Waste Trend (Line Chart)
         chart_frame4 = QFrame()
         chart_frame4.setObjectName("chartFrame")
-        chart_frame4.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout4 = QVBoxLayout(chart_frame4)
         chart_layout4.setContentsMargins(20, 20, 20, 20)
         
@@ -185,13 +177,6 @@ class DashboardPage(QWidget):
         # Assets by Type
         chart_frame5 = QFrame()
         chart_frame5.setObjectName("chartFrame")
-        chart_frame5.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout5 = QVBoxLayout(chart_frame5)
         chart_layout5.setContentsMargins(20, 20, 20, 20)
         
@@ -207,13 +192,6 @@ class DashboardPage(QWidget):
         # Asset Value by Type
         chart_frame6 = QFrame()
         chart_frame6.setObjectName("chartFrame")
-        chart_frame6.setStyleSheet("""
-            QFrame#chartFrame {
-                background-color: white;
-                border: 1px solid #e1e8ed;
-                border-radius: 8px;
-            }
-        """)
         chart_layout6 = QVBoxLayout(chart_frame6)
         chart_layout6.setContentsMargins(20, 20, 20, 20)
         
@@ -264,9 +242,8 @@ class DashboardPage(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         if icon:
-            icon_label = QLabel(icon)
-            icon_label.setFont(QFont("Segoe UI", 16))
-            icon_label.setStyleSheet(f"color: {color};")
+            icon_label = QLabel()
+            icon_label.setPixmap(_emoji_pixmap(icon))
             header_layout.addWidget(icon_label)
         
         title_label = QLabel(title)
@@ -289,29 +266,21 @@ class DashboardPage(QWidget):
     
     def refresh(self):
         """Refresh dashboard data"""
-        # Update primary metrics
-        products_count = get_products_count()
-        total_inventory_value = get_total_inventory_value()
-        total_waste = get_total_waste_quantity()
-        total_assets = get_total_asset_value()
-        
-        # Update secondary metrics
-        avg_price = get_average_product_price()
+        # All scalar KPIs come back in a single query
+        snapshot = get_dashboard_snapshot()
         low_stock_count = len(get_low_stock_products())
-        avg_asset_value = get_average_asset_value()
-        categories_data = get_products_by_category()
-        categories_count = len(categories_data)
-        
+        categories_count = len(get_products_by_category())
+
         # Update primary cards
-        self.update_card_value(self.products_card, str(products_count))
-        self.update_card_value(self.inventory_value_card, f"${total_inventory_value:,.2f}")
-        self.update_card_value(self.waste_card, str(total_waste))
-        self.update_card_value(self.assets_card, f"${total_assets:,.2f}")
-        
+        self.update_card_value(self.products_card, str(snapshot['products_count']))
+        self.update_card_value(self.inventory_value_card, f"${snapshot['inventory_value']:,.2f}")
+        self.update_card_value(self.waste_card, str(snapshot['waste_quantity']))
+        self.update_card_value(self.assets_card, f"${snapshot['asset_value']:,.2f}")
+
         # Update secondary cards
-        self.update_card_value(self.avg_price_card, f"${avg_price:.2f}")
+        self.update_card_value(self.avg_price_card, f"${snapshot['avg_product_price']:.2f}")
         self.update_card_value(self.low_stock_card, str(low_stock_count))
-        self.update_card_value(self.avg_asset_card, f"${avg_asset_value:,.2f}")
+        self.update_card_value(self.avg_asset_card, f"${snapshot['avg_asset_value']:,.2f}")
         self.update_card_value(self.categories_card, str(categories_count))
         
         # Update charts
@@ -331,62 +300,73 @@ class DashboardPage(QWidget):
     def update_category_chart(self):
         """Update products by category chart"""
         data = get_products_by_category()
-        self.update_chart_container(self.category_chart_container, 
-                                   lambda: create_pie_chart(data, "Products by Category"))
-    
+        self.update_chart_container(self.category_chart_container,
+                                    build_pie_figure, data, "Products by Category")
+
     def update_inventory_value_chart(self):
         """Update inventory value by category chart"""
         data = get_inventory_value_by_category()
         self.update_chart_container(self.inventory_value_chart_container,
-                                   lambda: create_bar_chart(data, "Inventory Value by Category", 
-                                                           "Category", "Value ($)", "#16a085", horizontal=True))
-    
+                                    build_bar_figure, data, "Inventory Value by Category",
+                                    "Category", "Value ($)", "#16a085", horizontal=True)
+
     def update_waste_reason_chart(self):
         """Update waste by reason chart"""
         data = get_waste_by_reason()
         self.update_chart_container(self.waste_reason_chart_container,
-                                   lambda: create_waste_by_reason_chart(data))
-    
+                                    build_waste_by_reason_figure, data)
+
     def update_waste_trend_chart(self):
         """Update waste trend chart"""
         data = get_waste_trend()
         # Reverse to show chronological order
         data = list(reversed(data))
         self.update_chart_container(self.waste_trend_chart_container,
-                                   lambda: create_line_chart(data, "Waste Trend", "Date", "Quantity"))
-    
+                                    build_line_figure, data, "Waste Trend", "Date", "Quantity")
+
     def update_assets_type_chart(self):
         """Update assets by type chart"""
         data = get_assets_by_type()
         self.update_chart_container(self.assets_type_chart_container,
-                                   lambda: create_pie_chart(data, "Assets by Type"))
-    
+                                    build_pie_figure, data, "Assets by Type")
+
     def update_assets_value_chart(self):
         """Update asset value by type chart"""
         data = get_assets_value_by_type()
         self.update_chart_container(self.assets_value_chart_container,
-                                   lambda: create_bar_chart(data, "Asset Value by Type",
-                                                           "Type", "Value ($)", "#2ecc71", horizontal=True))
-    
-    def update_chart_container(self, container: QWidget, chart_creator):
-        """Update a chart container with a new chart"""
+                                    build_bar_figure, data, "Asset Value by Type",
+                                    "Type", "Value ($)", "#2ecc71", horizontal=True)
+
+    def update_chart_container(self, container: QWidget, builder, data, *args, **kwargs):
+        """
+        Render a chart into the container's persistent canvas.
+
+        The first refresh creates one FigureCanvasQTAgg per container;
+        later refreshes redraw into the same figure (the build_* helpers
+        clear and reuse a figure passed via fig=), so no widgets or Agg
+        buffers are reallocated.
+        """
         layout = container.layout()
-        if layout:
-            while layout.count():
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-        else:
+        if layout is None:
             layout = QVBoxLayout(container)
             layout.setContentsMargins(0, 0, 0, 0)
-        
+
+        canvas = self._chart_canvases.get(container)
         try:
-            chart = chart_creator()
-            layout.addWidget(chart)
-        except Exception as e:
-            # If chart creation fails, show error message
-            error_label = QLabel(f"Unable to load chart")
-            error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            error_label.setStyleSheet("color: #7f8c8d; padding: 20px;")
-            layout.addWidget(error_label)
+            if canvas is None:
+                from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+                canvas = FigureCanvasQTAgg(builder(data, *args, **kwargs))
+                self._chart_canvases[container] = canvas
+                layout.addWidget(canvas)
+            else:
+                builder(data, *args, fig=canvas.figure, **kwargs)
+                canvas.draw()
+        except Exception:
+            # If chart rendering fails and there is no chart yet, show an
+            # error message; an existing chart keeps its last good state
+            if canvas is None:
+                error_label = QLabel("Unable to load chart")
+                error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                error_label.setStyleSheet("color: #7f8c8d; padding: 20px;")
+                layout.addWidget(error_label)
 
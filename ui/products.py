@@ -12,7 +12,7 @@ from utils.icons import get_icon, create_icon_button
 
 from database.db import (
     get_all_products, add_product, update_product, delete_product, get_product,
-    get_total_inventory_value, get_average_product_price, get_low_stock_products,
+    get_products_summary, get_low_stock_products,
     get_products_by_category, get_all_categories
 )
 from utils.helpers import (
@@ -390,15 +390,14 @@ class ProductsPage(QWidget):
         self.all_products = products
         self.populate_table(products)
         
-        # Update summary cards
-        total_value = get_total_inventory_value()
-        avg_price = get_average_product_price()
+        # Update summary cards (value/avg come back from one table scan)
+        summary = get_products_summary()
         low_stock_count = len(get_low_stock_products())
         categories_data = get_products_by_category()
         categories_count = len(categories_data)
-        
-        self.update_card_value(self.total_value_card, f"${total_value:,.2f}")
-        self.update_card_value(self.avg_price_card, f"${avg_price:.2f}")
+
+        self.update_card_value(self.total_value_card, f"${summary['inventory_value']:,.2f}")
+        self.update_card_value(self.avg_price_card, f"${summary['avg_price']:.2f}")
         self.update_card_value(self.low_stock_card, str(low_stock_count))
         self.update_card_value(self.categories_card, str(categories_count))
     
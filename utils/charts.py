@@ -1,19 +1,35 @@
 """
 Chart utilities for the CRM application
+
+The build_*_figure functions construct plain matplotlib Figures and touch no
+Qt objects, so they are safe to run on worker threads; callers on the GUI
+thread wrap a Figure in a FigureCanvasQTAgg themselves (see the dashboard)
+and pass it back via fig= to redraw in place.
 """
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from typing import List, Tuple
-import matplotlib.pyplot as plt
 
 
-def create_waste_by_reason_chart(data: List[Tuple[str, int]]) -> FigureCanvasQTAgg:
-    """Create a bar chart for waste by reason with percentages"""
-    fig = Figure(figsize=(7, 5))
+def _fresh_figure(fig: Figure, figsize: Tuple[float, float]) -> Figure:
+    """Clear and reuse an existing Figure, or allocate one
+
+    Reusing a Figure keeps its Agg backing buffer alive across redraws
+    instead of reallocating it for every refresh.
+    """
+    if fig is None:
+        return Figure(figsize=figsize)
+    fig.clf()
+    return fig
+
+
+
+def build_waste_by_reason_figure(data: List[Tuple[str, int]], fig: Figure = None) -> Figure:
+    """Build a bar chart figure for waste by reason with percentages"""
+    fig = _fresh_figure(fig, (7, 5))
     ax = fig.add_subplot(111)
-    
+
     if not data:
-        ax.text(0.5, 0.5, 'No data available', 
+        ax.text(0.5, 0.5, 'No data available',
                 horizontalalignment='center', verticalalignment='center',
                 transform=ax.transAxes, fontsize=14)
         ax.set_xticks([])
@@ -21,9 +37,9 @@ def create_waste_by_reason_chart(data: List[Tuple[str, int]]) -> FigureCanvasQTA
     else:
         # Filter out None values and ensure data is valid
         valid_data = [(str(item[0] or 'Unknown'), int(item[1] or 0)) for item in data if item[0] is not None]
-        
+
         if not valid_data:
-            ax.text(0.5, 0.5, 'No data available', 
+            ax.text(0.5, 0.5, 'No data available',
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax.transAxes, fontsize=14)
             ax.set_xticks([])
@@ -31,21 +47,21 @@ def create_waste_by_reason_chart(data: List[Tuple[str, int]]) -> FigureCanvasQTA
         else:
             reasons = [item[0] for item in valid_data]
             quantities = [item[1] for item in valid_data]
-            
+
             # Calculate percentages
             total = sum(quantities) if quantities else 1
             percentages = [(q / total * 100) if total > 0 else 0 for q in quantities]
-            
+
             # Truncate long reason names
             truncated_reasons = [reason[:15] + '...' if len(reason) > 15 else reason for reason in reasons]
-            
+
             bars = ax.bar(truncated_reasons, quantities, color=['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6'], width=0.6)
             ax.set_xlabel('Reason', fontsize=10)
             ax.set_ylabel('Quantity', fontsize=10)
             ax.set_title('Waste by Reason', fontsize=12, fontweight='bold', pad=15)
             ax.tick_params(axis='x', rotation=45, labelsize=9)
             ax.tick_params(axis='y', labelsize=9)
-            
+
             # Add value and percentage labels on bars
             for i, bar in enumerate(bars):
                 height = bar.get_height()
@@ -53,19 +69,19 @@ def create_waste_by_reason_chart(data: List[Tuple[str, int]]) -> FigureCanvasQTA
                 ax.text(bar.get_x() + bar.get_width()/2., height + height*0.02,
                        f'{int(height)}\n({pct:.1f}%)',
                        ha='center', va='bottom', fontsize=8)
-    
+
     fig.tight_layout(pad=2.5)
-    canvas = FigureCanvasQTAgg(fig)
-    return canvas
+    return fig
 
 
-def create_pie_chart(data: List[Tuple[str, float]], title: str, colors: List[str] = None) -> FigureCanvasQTAgg:
-    """Create a pie chart"""
-    fig = Figure(figsize=(6, 5))
+def build_pie_figure(data: List[Tuple[str, float]], title: str, colors: List[str] = None,
+                     fig: Figure = None) -> Figure:
+    """Build a pie chart figure"""
+    fig = _fresh_figure(fig, (6, 5))
     ax = fig.add_subplot(111)
-    
+
     if not data:
-        ax.text(0.5, 0.5, 'No data available', 
+        ax.text(0.5, 0.5, 'No data available',
                 horizontalalignment='center', verticalalignment='center',
                 transform=ax.transAxes, fontsize=14)
         ax.set_xticks([])
@@ -73,9 +89,9 @@ def create_pie_chart(data: List[Tuple[str, float]], title: str, colors: List[str
     else:
         # Filter out None values and ensure data is valid
         valid_data = [(str(item[0] or 'Unknown'), float(item[1] or 0)) for item in data if item[0] is not None]
-        
+
         if not valid_data:
-            ax.text(0.5, 0.5, 'No data available', 
+            ax.text(0.5, 0.5, 'No data available',
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax.transAxes, fontsize=14)
             ax.set_xticks([])
@@ -83,32 +99,31 @@ def create_pie_chart(data: List[Tuple[str, float]], title: str, colors: List[str
         else:
             labels = [item[0] for item in valid_data]
             values = [item[1] for item in valid_data]
-            
+
             if colors is None:
                 colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c', '#34495e', '#e67e22']
-            
+
             # Truncate long labels more aggressively
             truncated_labels = [label[:12] + '...' if len(label) > 12 else label for label in labels]
-            
+
             # Use smaller font and adjust label distance
-            ax.pie(values, labels=truncated_labels, autopct='%1.1f%%', startangle=90, 
+            ax.pie(values, labels=truncated_labels, autopct='%1.1f%%', startangle=90,
                    colors=colors[:len(valid_data)], textprops={'fontsize': 8}, labeldistance=1.05)
             ax.set_title(title, fontsize=11, fontweight='bold', pad=10)
-    
+
     fig.tight_layout(pad=1.5)
-    canvas = FigureCanvasQTAgg(fig)
-    canvas.setSizePolicy(canvas.sizePolicy().horizontalPolicy(), canvas.sizePolicy().verticalPolicy())
-    return canvas
+    return fig
 
 
-def create_bar_chart(data: List[Tuple[str, float]], title: str, xlabel: str, ylabel: str, 
-                     color: str = '#3498db', horizontal: bool = False) -> FigureCanvasQTAgg:
-    """Create a bar chart"""
-    fig = Figure(figsize=(7, 5))
+def build_bar_figure(data: List[Tuple[str, float]], title: str, xlabel: str, ylabel: str,
+                     color: str = '#3498db', horizontal: bool = False,
+                     fig: Figure = None) -> Figure:
+    """Build a bar chart figure"""
+    fig = _fresh_figure(fig, (7, 5))
     ax = fig.add_subplot(111)
-    
+
     if not data:
-        ax.text(0.5, 0.5, 'No data available', 
+        ax.text(0.5, 0.5, 'No data available',
                 horizontalalignment='center', verticalalignment='center',
                 transform=ax.transAxes, fontsize=14)
         ax.set_xticks([])
@@ -116,9 +131,9 @@ def create_bar_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yla
     else:
         # Filter out None values and ensure data is valid
         valid_data = [(str(item[0] or 'Unknown'), float(item[1] or 0)) for item in data if item[0] is not None]
-        
+
         if not valid_data:
-            ax.text(0.5, 0.5, 'No data available', 
+            ax.text(0.5, 0.5, 'No data available',
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax.transAxes, fontsize=14)
             ax.set_xticks([])
@@ -126,11 +141,11 @@ def create_bar_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yla
         else:
             labels = [item[0] for item in valid_data]
             values = [item[1] for item in valid_data]
-        
+
             # Calculate percentages
             total = sum(values) if values else 1
             percentages = [(v / total * 100) if total > 0 else 0 for v in values]
-            
+
             if horizontal:
                 # Truncate long labels for horizontal bars
                 truncated_labels = [label[:20] + '...' if len(label) > 20 else label for label in labels]
@@ -161,21 +176,21 @@ def create_bar_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yla
                     ax.text(bar.get_x() + bar.get_width()/2., height + height*0.02,
                            f'{value_str}\n({pct:.1f}%)',
                            ha='center', va='bottom', fontsize=8)
-            
+
             ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
-    
+
     fig.tight_layout(pad=2.5)
-    canvas = FigureCanvasQTAgg(fig)
-    return canvas
+    return fig
 
 
-def create_line_chart(data: List[Tuple[str, float]], title: str, xlabel: str, ylabel: str) -> FigureCanvasQTAgg:
-    """Create a line chart"""
-    fig = Figure(figsize=(7, 5))
+def build_line_figure(data: List[Tuple[str, float]], title: str, xlabel: str, ylabel: str,
+                      fig: Figure = None) -> Figure:
+    """Build a line chart figure"""
+    fig = _fresh_figure(fig, (7, 5))
     ax = fig.add_subplot(111)
-    
+
     if not data:
-        ax.text(0.5, 0.5, 'No data available', 
+        ax.text(0.5, 0.5, 'No data available',
                 horizontalalignment='center', verticalalignment='center',
                 transform=ax.transAxes, fontsize=14)
         ax.set_xticks([])
@@ -183,9 +198,9 @@ def create_line_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yl
     else:
         # Filter out None values and ensure data is valid
         valid_data = [(str(item[0] or ''), float(item[1] or 0)) for item in data if item[0] is not None]
-        
+
         if not valid_data:
-            ax.text(0.5, 0.5, 'No data available', 
+            ax.text(0.5, 0.5, 'No data available',
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax.transAxes, fontsize=14)
             ax.set_xticks([])
@@ -193,7 +208,7 @@ def create_line_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yl
         else:
             labels = [item[0] for item in valid_data]
             values = [item[1] for item in valid_data]
-        
+
             # Format date labels if they look like dates
             formatted_labels = []
             for label in labels:
@@ -202,7 +217,7 @@ def create_line_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yl
                     formatted_labels.append(label.split('-')[2] + '/' + label.split('-')[1])
                 else:
                     formatted_labels.append(label[:10] + '...' if len(label) > 10 else label)
-            
+
             ax.plot(formatted_labels, values, marker='o', color='#3498db', linewidth=2, markersize=8)
             ax.set_xlabel(xlabel, fontsize=10)
             ax.set_ylabel(ylabel, fontsize=10)
@@ -210,7 +225,7 @@ def create_line_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yl
             ax.tick_params(axis='x', rotation=45, labelsize=9)
             ax.tick_params(axis='y', labelsize=9)
             ax.grid(True, alpha=0.3)
-            
+
             # Add value labels with percentage change from previous point
             max_value = max(values) if values else 1
             offset = max_value * 0.05 if max_value > 0 else 1
@@ -227,8 +242,6 @@ def create_line_chart(data: List[Tuple[str, float]], title: str, xlabel: str, yl
                     pct = (value / total * 100) if total > 0 else 0
                     value_label += f'\n({pct:.1f}%)'
                 ax.text(i, value + offset, value_label, ha='center', va='bottom', fontsize=8)
-    
-    fig.tight_layout(pad=2.5)
-    canvas = FigureCanvasQTAgg(fig)
-    return canvas
 
+    fig.tight_layout(pad=2.5)
+    return fig
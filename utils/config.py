@@ -179,6 +179,29 @@ def get_config_value(key: str, default: Any = None) -> Any:
         return config.get(key, default)
 
 
+def get_last_update_check_ts() -> float:
+    """
+    Get the wall-clock timestamp of the last update check
+
+    Returns:
+        Seconds since the epoch, or 0.0 if no check has been recorded
+    """
+    return get_config_value("last_update_check_ts", 0.0)
+
+
+def set_last_update_check_ts(ts: float) -> bool:
+    """
+    Persist the wall-clock timestamp of the last update check
+
+    Args:
+        ts: Seconds since the epoch
+
+    Returns:
+        True if successful, False otherwise
+    """
+    return set_config("last_update_check_ts", ts)
+
+
 def is_setup_complete() -> bool:
     """
     Check if setup has been completed
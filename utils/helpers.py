@@ -3,8 +3,8 @@ Helper utilities for the CRM application
 """
 from PyQt6.QtWidgets import QMessageBox, QFileDialog
 from PyQt6.QtCore import Qt
-import pandas as pd
-from typing import List, Dict, Tuple
+import csv
+from typing import Iterable, List, Tuple
 
 
 def show_error_message(parent, title: str, message: str):
@@ -37,10 +37,14 @@ def show_confirm_dialog(parent, title: str, message: str) -> bool:
     return reply == QMessageBox.StandardButton.Yes
 
 
+# Characters stripped before numeric parsing ($ signs, thousands commas, spaces)
+_NUMERIC_CLEAN = str.maketrans('', '', '$, ')
+
+
 def validate_number(value: str, field_name: str = "Value") -> Tuple[bool, float]:
-    """Validate and convert string to float"""
+    """Validate and convert string to float, tolerating $, commas and spaces"""
     try:
-        num = float(value)
+        num = float(value.translate(_NUMERIC_CLEAN))
         if num < 0:
             return False, 0.0
         return True, num
@@ -59,8 +63,49 @@ def validate_integer(value: str, field_name: str = "Value") -> Tuple[bool, int]:
         return False, 0
 
 
-def export_to_csv(data: List[Dict], headers: List[str], parent=None) -> bool:
-    """Export data to CSV file"""
+def _iter_export_rows(data: Iterable, headers: List[str]) -> Iterable[List]:
+    """Normalize export rows to plain sequences, one row at a time"""
+    for row in data:
+        if isinstance(row, dict):
+            yield [row.get(h, '') for h in headers]
+        else:
+            yield row
+
+
+def write_csv(file_path: str, data: Iterable, headers: List[str]):
+    """
+    Write rows to a CSV file.
+
+    Pure file I/O with no Qt involvement, so it is safe to call from a
+    worker thread. Rows are written as they are produced, so `data` can
+    be a generator; peak memory stays flat regardless of row count.
+    """
+    # 1 MB buffer: many rows per write syscall instead of the ~8 KB default
+    with open(file_path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(_iter_export_rows(data, headers))
+
+
+def write_excel(file_path: str, data: Iterable, headers: List[str]):
+    """
+    Write rows to an Excel file.
+
+    Pure file I/O with no Qt involvement, so it is safe to call from a
+    worker thread. Uses an openpyxl write-only workbook and appends rows
+    as they are produced, so `data` can be a generator.
+    """
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(headers)
+    for row in _iter_export_rows(data, headers):
+        ws.append(list(row))
+    wb.save(file_path)
+
+
+def export_to_csv(data: Iterable, headers: List[str], parent=None) -> bool:
+    """Ask for a destination and export data to a CSV file"""
     try:
         file_path, _ = QFileDialog.getSaveFileName(
             parent,
@@ -68,20 +113,19 @@ def export_to_csv(data: List[Dict], headers: List[str], parent=None) -> bool:
             "",
             "CSV Files (*.csv);;All Files (*)"
         )
-        
+
         if not file_path:
             return False
-        
-        df = pd.DataFrame(data)
-        df.to_csv(file_path, index=False)
+
+        write_csv(file_path, data, headers)
         return True
     except Exception as e:
         show_error_message(parent, "Export Error", f"Failed to export CSV: {str(e)}")
         return False
 
 
-def export_to_excel(data: List[Dict], headers: List[str], parent=None) -> bool:
-    """Export data to Excel file"""
+def export_to_excel(data: Iterable, headers: List[str], parent=None) -> bool:
+    """Ask for a destination and export data to an Excel file"""
     try:
         file_path, _ = QFileDialog.getSaveFileName(
             parent,
@@ -89,12 +133,11 @@ def export_to_excel(data: List[Dict], headers: List[str], parent=None) -> bool:
             "",
             "Excel Files (*.xlsx);;All Files (*)"
         )
-        
+
         if not file_path:
             return False
-        
-        df = pd.DataFrame(data)
-        df.to_excel(file_path, index=False, engine='openpyxl')
+
+        write_excel(file_path, data, headers)
         return True
     except Exception as e:
         show_error_message(parent, "Export Error", f"Failed to export Excel: {str(e)}")